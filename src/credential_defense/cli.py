@@ -157,28 +157,29 @@ def _cmd_session(args: argparse.Namespace) -> int:
         raise VaultError("Vault missing. Run `credential-defense init` first.")
     settings = load_settings()
     master = _prompt_master_password(env_var=args.master_password_env)
-    records = vault.list_records(master)
-    if not records:
-        print("Vault is empty. Import browser exports first.")
-        return 0
-
-    hibp_api_key = None
-    if args.online_email_check:
-        hibp_api_key = os.environ.get(args.hibp_api_key_env)
-        if not hibp_api_key:
-            print(
-                f"{args.hibp_api_key_env} is not set; email breach checks will be skipped "
-                "for this run."
-            )
-
-    updated_records, tasks = run_guided_session(
-        records,
-        settings,
-        online_password_check=args.online_password_check,
-        online_email_check=args.online_email_check and bool(hibp_api_key),
-        hibp_api_key=hibp_api_key,
-    )
-    vault.upsert_records(master, updated_records)
+    with vault.session(master) as vault_session:
+        records = vault_session.list_records()
+        if not records:
+            print("Vault is empty. Import browser exports first.")
+            return 0
+
+        hibp_api_key = None
+        if args.online_email_check:
+            hibp_api_key = os.environ.get(args.hibp_api_key_env)
+            if not hibp_api_key:
+                print(
+                    f"{args.hibp_api_key_env} is not set; email breach checks will be skipped "
+                    "for this run."
+                )
+
+        updated_records, tasks = run_guided_session(
+            records,
+            settings,
+            online_password_check=args.online_password_check,
+            online_email_check=args.online_email_check and bool(hibp_api_key),
+            hibp_api_key=hibp_api_key,
+        )
+        vault_session.upsert_records(updated_records)
     pending_count = sum(1 for task in tasks if task.status == "pending")
     print(f"Session complete. Pending actions: {pending_count}")
     return 0
@@ -190,14 +191,15 @@ def _cmd_run_actions(args: argparse.Namespace) -> int:
     if not vault.exists():
         raise VaultError("Vault missing. Run `credential-defense init` first.")
     master = _prompt_master_password(env_var=args.master_password_env)
-    records = {item.record_id: item for item in vault.list_records(master)}
-    tasks = load_action_queue()
-    if not tasks:
-        print("Action queue is empty.")
-        return 0
-    site_profiles = load_site_profiles()
-    execute_pending_actions(tasks, records, site_profiles)
-    vault.upsert_records(master, list(records.values()))
+    with vault.session(master) as vault_session:
+        records = {item.record_id: item for item in vault_session.list_records()}
+        tasks = load_action_queue()
+        if not tasks:
+            print("Action queue is empty.")
+            return 0
+        site_profiles = load_site_profiles()
+        execute_pending_actions(tasks, records, site_profiles)
+        vault_session.upsert_records(list(records.values()))
     print("Action runner finished.")
     return 0
 
@@ -4,6 +4,11 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 
 WORKSPACE_ROOT = Path(__file__).resolve().parents[2]
 CONFIG_DIR = WORKSPACE_ROOT / "config"
@@ -19,10 +24,12 @@ ACTION_QUEUE_PATH = DATA_DIR / "action_queue.json"
 LOCAL_BREACH_CACHE_PATH = DATA_DIR / "local_breach_cache.json"
 SESSION_JOURNAL_PATH = DATA_DIR / "session_journal.jsonl"
 WATCHDOG_STATUS_PATH = DATA_DIR / "runtime_watchdog_status.json"
+WATCHDOG_HEARTBEAT_PATH = DATA_DIR / "runtime_watchdog_heartbeat.txt"
 
 SUPPORT_STATE_DIR = WORKSPACE_ROOT / "state" / "support"
 SUPPORT_LOG_DIR = WORKSPACE_ROOT / "logs" / "support"
 SUPPORT_TICKETS_PATH = SUPPORT_STATE_DIR / "tickets.json"
+SUPPORT_TICKETS_LOG_PATH = SUPPORT_STATE_DIR / "tickets_log.jsonl"
 SUPPORT_TICKET_EVENTS_PATH = SUPPORT_LOG_DIR / "ticket_events.jsonl"
 SUPPORT_CHAT_LOG_PATH = SUPPORT_LOG_DIR / "chat_sessions.jsonl"
 SUPPORT_SUMMARY_PATH = SUPPORT_STATE_DIR / "summary.json"
@@ -543,9 +550,37 @@ def load_json(path: Path, fallback: Any) -> Any:
         return fallback
 
 
+def json_dumps(payload: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            # orjson rejects a few payloads stdlib json accepts (e.g. >64-bit ints).
+            pass
+    if indent:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_line(payload: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def json_loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def save_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_bytes(json_dumps(payload, indent=True))
 
 
 def load_settings() -> dict[str, Any]:
@@ -3,19 +3,43 @@ from __future__ import annotations
 import getpass
 import os
 import platform
+import re
 import socket
+import stat
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from .config import WATCHDOG_STATUS_PATH, default_settings, save_json
+from .config import WATCHDOG_HEARTBEAT_PATH, WATCHDOG_STATUS_PATH, default_settings, save_json
 from .utils import utc_now_iso
 
 
 KNOWN_BROWSERS = ("chrome", "chromium", "brave", "edge", "firefox")
-_WINDOWS_IGNORED_USERS = {"all users", "default", "default user", "defaultaccount", "public"}
-
-
+_WINDOWS_IGNORED_USERS = frozenset({"all users", "default", "default user", "defaultaccount", "public"})
+_DEFAULT_PRESENCE_SUMMARY: dict[str, bool] = {browser: False for browser in KNOWN_BROWSERS}
+_SERVICE_OS_FAMILIES = frozenset({"linux", "windows"})
+_MOUNTINFO_PATH = "/proc/self/mountinfo"
+_MOUNTINFO_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+_LINUX_BROWSER_RELPATHS: dict[str, tuple[str, ...]] = {
+    "chrome": (".config", "google-chrome"),
+    "chromium": (".config", "chromium"),
+    "brave": (".config", "BraveSoftware", "Brave-Browser"),
+    "edge": (".config", "microsoft-edge"),
+    "firefox": (".mozilla", "firefox"),
+}
+_WINDOWS_BROWSER_RELPATHS: dict[str, tuple[str, ...]] = {
+    "chrome": ("AppData", "Local", "Google", "Chrome", "User Data"),
+    "chromium": ("AppData", "Local", "Chromium", "User Data"),
+    "brave": ("AppData", "Local", "BraveSoftware", "Brave-Browser", "User Data"),
+    "edge": ("AppData", "Local", "Microsoft", "Edge", "User Data"),
+    "firefox": ("AppData", "Roaming", "Mozilla", "Firefox"),
+}
+
+
+@lru_cache(maxsize=1)
 def detect_os_family() -> str:
     system = platform.system().lower()
     if system.startswith("win"):
@@ -27,30 +51,26 @@ def detect_os_family() -> str:
     return "other"
 
 
+def _is_existing_dir(path: Path) -> bool:
+    # One stat() instead of the exists() + is_dir() pair.
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=16)
 def _linux_browser_paths(home: Path) -> dict[str, Path]:
-    return {
-        "chrome": home / ".config" / "google-chrome",
-        "chromium": home / ".config" / "chromium",
-        "brave": home / ".config" / "BraveSoftware" / "Brave-Browser",
-        "edge": home / ".config" / "microsoft-edge",
-        "firefox": home / ".mozilla" / "firefox",
-    }
+    return {browser: home.joinpath(*parts) for browser, parts in _LINUX_BROWSER_RELPATHS.items()}
 
 
+@lru_cache(maxsize=16)
 def _windows_browser_paths(user_profile: Path) -> dict[str, Path]:
-    local = user_profile / "AppData" / "Local"
-    roaming = user_profile / "AppData" / "Roaming"
-    return {
-        "chrome": local / "Google" / "Chrome" / "User Data",
-        "chromium": local / "Chromium" / "User Data",
-        "brave": local / "BraveSoftware" / "Brave-Browser" / "User Data",
-        "edge": local / "Microsoft" / "Edge" / "User Data",
-        "firefox": roaming / "Mozilla" / "Firefox",
-    }
+    return {browser: user_profile.joinpath(*parts) for browser, parts in _WINDOWS_BROWSER_RELPATHS.items()}
 
 
 def _collect_user_dirs(users_root: Path, user_hints: list[str]) -> list[Path]:
-    if not users_root.exists() or not users_root.is_dir():
+    if not _is_existing_dir(users_root):
         return []
     hints = [hint.strip().lower() for hint in user_hints if str(hint).strip()]
     results: list[Path] = []
@@ -69,6 +89,60 @@ def _collect_user_dirs(users_root: Path, user_hints: list[str]) -> list[Path]:
     return results
 
 
+def _read_mount_points() -> frozenset[str] | None:
+    try:
+        with open(_MOUNTINFO_PATH, encoding="utf-8") as handle:
+            lines = handle.readlines()
+    except OSError:
+        return None
+    mount_points: set[str] = set()
+    for line in lines:
+        fields = line.split()
+        if len(fields) > 4:
+            mount_points.add(_MOUNTINFO_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), fields[4]))
+    return frozenset(mount_points)
+
+
+def _has_mount_under(mount_root: Path, mount_points: frozenset[str] | None) -> bool:
+    if mount_points is None:
+        # No mount table (non-Linux /proc); scan rather than guess.
+        return True
+    root = os.path.realpath(mount_root)
+    prefix = root.rstrip("/") + "/"
+    return any(point == root or point.startswith(prefix) for point in mount_points)
+
+
+def _scan_mount_root(
+    mount_root_str: str,
+    user_hints: list[str],
+    mount_points: frozenset[str] | None = None,
+) -> list[Path]:
+    mount_root = Path(str(mount_root_str)).expanduser()
+    if not mount_root.exists():
+        return []
+    if not _has_mount_under(mount_root, mount_points):
+        return []
+
+    found: list[Path] = []
+    direct_candidates = [
+        mount_root / "c" / "Users",
+        mount_root / "C" / "Users",
+        mount_root / "Users",
+    ]
+    for candidate in direct_candidates:
+        for profile_dir in _collect_user_dirs(candidate, user_hints):
+            found.append(profile_dir.resolve())
+
+    try:
+        for child in mount_root.iterdir():
+            users_dir = child / "Users"
+            for profile_dir in _collect_user_dirs(users_dir, user_hints):
+                found.append(profile_dir.resolve())
+    except PermissionError:
+        pass
+    return found
+
+
 def _discover_windows_profiles_from_linux(settings: dict[str, Any]) -> list[Path]:
     watchdog_cfg = settings.get("watchdog", {})
     if not watchdog_cfg.get("enable_windows_mount_scan_on_linux", True):
@@ -79,37 +153,24 @@ def _discover_windows_profiles_from_linux(settings: dict[str, Any]) -> list[Path
     profiles: list[Path] = []
     seen: set[str] = set()
 
-    for mount_root_str in mount_candidates:
-        mount_root = Path(str(mount_root_str)).expanduser()
-        if not mount_root.exists():
-            continue
-
-        direct_candidates = [
-            mount_root / "c" / "Users",
-            mount_root / "C" / "Users",
-            mount_root / "Users",
-        ]
-        for candidate in direct_candidates:
-            for profile_dir in _collect_user_dirs(candidate, user_hints):
-                key = str(profile_dir.resolve())
+    # Mount roots are independent and often slow (network/fuse mounts), so
+    # scan them concurrently; results are merged in candidate order.
+    if mount_candidates:
+        mount_points = _read_mount_points()
+        with ThreadPoolExecutor(max_workers=len(mount_candidates)) as executor:
+            scans = list(
+                executor.map(lambda root: _scan_mount_root(root, user_hints, mount_points), mount_candidates)
+            )
+        for found in scans:
+            for profile_dir in found:
+                key = str(profile_dir)
                 if key not in seen:
                     seen.add(key)
-                    profiles.append(profile_dir.resolve())
-
-        try:
-            for child in mount_root.iterdir():
-                users_dir = child / "Users"
-                for profile_dir in _collect_user_dirs(users_dir, user_hints):
-                    key = str(profile_dir.resolve())
-                    if key not in seen:
-                        seen.add(key)
-                        profiles.append(profile_dir.resolve())
-        except PermissionError:
-            continue
+                    profiles.append(profile_dir)
 
     for explicit in watchdog_cfg.get("windows_profiles", []) or []:
         profile = Path(str(explicit)).expanduser()
-        if profile.exists() and profile.is_dir():
+        if _is_existing_dir(profile):
             key = str(profile.resolve())
             if key not in seen:
                 seen.add(key)
@@ -136,7 +197,7 @@ def _build_browser_path_records(settings: dict[str, Any]) -> list[dict[str, Any]
             )
         for explicit in settings.get("watchdog", {}).get("windows_profiles", []) or []:
             candidate = Path(str(explicit)).expanduser()
-            if not candidate.exists() or not candidate.is_dir():
+            if not _is_existing_dir(candidate):
                 continue
             if candidate == user_profile:
                 continue
@@ -181,18 +242,24 @@ def _build_browser_path_records(settings: dict[str, Any]) -> list[dict[str, Any]
 
 
 def summarize_browser_presence(status: dict[str, Any]) -> dict[str, bool]:
-    summary = {browser: False for browser in KNOWN_BROWSERS}
+    summary = _DEFAULT_PRESENCE_SUMMARY.copy()
+    remaining = len(summary)
     for item in status.get("browser_paths", []):
         browser = item.get("browser")
-        if browser in summary and bool(item.get("present")):
+        if summary.get(browser) is False and bool(item.get("present")):
             summary[browser] = True
+            remaining -= 1
+            if not remaining:
+                break
     return summary
 
 
 def build_runtime_status(settings: dict[str, Any] | None = None) -> dict[str, Any]:
     cfg = settings or default_settings()
     os_family = detect_os_family()
-    browser_records = _build_browser_path_records(cfg)
+    service_available = os_family in _SERVICE_OS_FAMILIES
+    # Browser discovery only knows Linux/Windows layouts; skip it elsewhere.
+    browser_records = _build_browser_path_records(cfg) if service_available else []
     status = {
         "timestamp": utc_now_iso(),
         "os_family": os_family,
@@ -200,10 +267,13 @@ def build_runtime_status(settings: dict[str, Any] | None = None) -> dict[str, An
         "hostname": socket.gethostname(),
         "active_user": getpass.getuser(),
         "workspace_root": str(Path(__file__).resolve().parents[2]),
-        "service_available": os_family in {"linux", "windows"},
+        "service_available": service_available,
         "browser_paths": browser_records,
     }
-    status["browser_presence"] = summarize_browser_presence(status)
+    if browser_records:
+        status["browser_presence"] = summarize_browser_presence(status)
+    else:
+        status["browser_presence"] = _DEFAULT_PRESENCE_SUMMARY.copy()
     return status
 
 
@@ -212,6 +282,12 @@ def write_runtime_status(status: dict[str, Any]) -> Path:
     return WATCHDOG_STATUS_PATH
 
 
+def write_runtime_heartbeat(timestamp: str) -> Path:
+    WATCHDOG_HEARTBEAT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    WATCHDOG_HEARTBEAT_PATH.write_text(f"{timestamp}\n", encoding="utf-8")
+    return WATCHDOG_HEARTBEAT_PATH
+
+
 def watchdog_loop(
     settings: dict[str, Any] | None = None,
     *,
@@ -221,15 +297,31 @@ def watchdog_loop(
 ) -> int:
     cfg = settings or default_settings()
     cycles = 0
+    last_status_sans_ts: dict[str, Any] | None = None
+    period = max(interval_seconds, 1)
+    next_deadline = time.monotonic()
     while True:
+        next_deadline += period
         status = build_runtime_status(cfg)
-        path = write_runtime_status(status)
+        # Only the timestamp moves in the steady state; refresh the small
+        # heartbeat sidecar instead of rewriting the full status document.
+        status_sans_ts = {key: value for key, value in status.items() if key != "timestamp"}
+        if status_sans_ts == last_status_sans_ts:
+            write_runtime_heartbeat(status["timestamp"])
+        else:
+            write_runtime_status(status)
+            last_status_sans_ts = status_sans_ts
         cycles += 1
         if print_updates:
             print(
                 f"[{status['timestamp']}] os={status['os_family']} "
-                f"service_available={status['service_available']} status={path}"
+                f"service_available={status['service_available']} status={WATCHDOG_STATUS_PATH}"
             )
         if max_cycles > 0 and cycles >= max_cycles:
             return 0
-        time.sleep(max(interval_seconds, 1))
+        # Sleep to a fixed monotonic cadence so slow cycles do not shift the
+        # phase; if a cycle overran a whole period, restart from now.
+        now = time.monotonic()
+        if next_deadline <= now:
+            next_deadline = now
+        time.sleep(next_deadline - now)
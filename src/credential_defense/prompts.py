@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
 
 def prompt_yes_no(question: str, default: bool | None = None) -> bool:
     suffix = " [y/n]: "
@@ -11,9 +14,9 @@ def prompt_yes_no(question: str, default: bool | None = None) -> bool:
         response = input(question + suffix).strip().lower()
         if not response and default is not None:
             return default
-        if response in {"y", "yes"}:
+        if response in _YES:
             return True
-        if response in {"n", "no"}:
+        if response in _NO:
             return False
         print("Please answer y or n.")
 
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
 import argparse
+import email.utils
+import heapq
+import http.cookiejar
 import json
 import mimetypes
 import os
+import queue
 import re
+import stat
 import threading
 import time
 import uuid
+from collections import Counter
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Callable, Iterator
+from urllib.parse import unquote_plus, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import (
     SETTINGS_PATH,
@@ -25,9 +32,13 @@ from .config import (
     SUPPORT_FEEDBACK_PATH,
     SUPPORT_SUMMARY_PATH,
     SUPPORT_TICKET_EVENTS_PATH,
+    SUPPORT_TICKETS_LOG_PATH,
     SUPPORT_TICKETS_PATH,
     WORKSPACE_ROOT,
     ensure_workspace_files,
+    json_dumps,
+    json_dumps_line,
+    json_loads,
 )
 from .device_umbrella import DeviceUmbrellaStore
 
@@ -37,41 +48,173 @@ SECRET_PATTERN = re.compile(
 )
 DECLARED_PASSWORD_PATTERN = re.compile(r"(?i)\b(my password is|password is)\s+([^\s,;]+)")
 LONG_TOKEN_PATTERN = re.compile(r"\b[A-Za-z0-9_\-]{28,}\b")
-COPILOT_ALLOWED_ROUTES = {
-    "RUN_ONE_TIME_SCAN",
-    "RUN_SCAM_TRIAGE",
-    "OPEN_CREDENTIAL_CENTER",
-    "OPEN_SUPPORT",
-}
+LONG_TOKEN_MIN_CHARS = 28
+COPILOT_ALLOWED_ROUTES = frozenset(
+    {
+        "RUN_ONE_TIME_SCAN",
+        "RUN_SCAM_TRIAGE",
+        "OPEN_CREDENTIAL_CENTER",
+        "OPEN_SUPPORT",
+    }
+)
+# Used when neither the client nor the connected AI supplied a valid action.
+DEFAULT_COPILOT_ACTIONS: tuple[dict[str, str], ...] = (
+    {
+        "title": "Run one-time scan now",
+        "rationale": "Refresh local evidence before additional sensitive actions.",
+        "route": "RUN_ONE_TIME_SCAN",
+    },
+)
 DEFAULT_CONNECTED_AI_PROVIDERS = ["openai"]
 DEFAULT_CONNECTED_AI_MODELS = ["gpt-4.1-mini", "gpt-4o-mini", "gpt-4.1"]
+FLUSH_INTERVAL_SECONDS = 0.05
+# Keyword -> intents, matched as plain substrings like the old `in` checks.
+# "ticket" marks messages that auto-open a ticket from chat.
+CHAT_INTENT_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "feature request": ("feature", "ticket"),
+    "problem report": ("problem", "ticket"),
+    "open ticket": ("ticket",),
+    "bug": ("problem", "ticket"),
+    "feature": ("feature",),
+    "add": ("add",),
+    "error": ("problem",),
+    "problem": ("problem",),
+    "issue": ("problem",),
+    "price": ("billing",),
+    "billing": ("billing",),
+    "trial": ("billing",),
+}
+# One scan; the lookahead lets keywords overlap ("feature request" also
+# yields "feature" via the mapping above, longer phrases are tried first).
+CHAT_INTENT_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in sorted(CHAT_INTENT_KEYWORDS, key=len, reverse=True)) + "))",
+    re.IGNORECASE,
+)
+TICKET_SNAPSHOT_EVERY_OPS = 1000
+# Logged ticket ops older than this are folded into tickets.json even when
+# fewer than TICKET_SNAPSHOT_EVERY_OPS have accumulated.
+TICKET_SNAPSHOT_MAX_AGE_SECONDS = 300.0
+TAIL_READ_CHUNK_BYTES = 64 * 1024
+# (connect, read): fail fast on an unreachable provider, allow slow completions.
+AI_REQUEST_TIMEOUT = (5, 30)
+# Retry connect failures and throttling/5xx answers with a short backoff. Once
+# the POST has been sent, read and other errors are not retried: the provider
+# may already be generating (and billing) the completion. Retry-After is
+# ignored so a throttling provider cannot park a caller for minutes; the
+# backoff is capped instead.
+AI_REQUEST_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    other=0,
+    status=2,
+    backoff_factor=0.3,
+    backoff_max=2.0,
+    respect_retry_after_header=False,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+# Provider calls in flight at once; chat callers past the cap get the local reply.
+AI_MAX_CONCURRENT_CALLS = 8
+# The background triage worker waits this long for a call slot before falling back.
+AI_TRIAGE_SLOT_WAIT_SECONDS = 120.0
+# Idle keep-alive connections hold a handler thread; drop them after this long.
+HTTP_IDLE_TIMEOUT_SECONDS = 15.0
+STATUS_LINES = {status: b"HTTP/1.1 %d %s\r\n" % (status.value, status.phrase.encode("latin-1")) for status in HTTPStatus}
+CONTENT_TYPE_JSON = b"Content-Type: application/json; charset=utf-8\r\n"
+CONTENT_TYPE_TEXT = b"Content-Type: text/plain; charset=utf-8\r\n"
+CORS_HEADER_BYTES = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+    b"Access-Control-Allow-Methods: GET,POST,OPTIONS\r\n"
+)
+STATIC_CACHE_MAX_FILE_BYTES = 512 * 1024
+STATIC_CACHE_MAX_ENTRIES = 128
+
+
+_now_iso_cache: tuple[int, str] = (-1, "")
 
 
 def now_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Second resolution, so repeated calls within a second reuse the string.
+    # The cache is a single tuple, so concurrent callers never see a torn pair.
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, cached_iso = _now_iso_cache
+    if second == cached_second:
+        return cached_iso
+    iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+    _now_iso_cache = (second, iso)
+    return iso
+
+
+def chat_intents(text: str) -> frozenset[str]:
+    found: set[str] = set()
+    for match in CHAT_INTENT_PATTERN.finditer(text):
+        found.update(CHAT_INTENT_KEYWORDS[match.group(1).lower()])
+    return frozenset(found)
 
 
 def sanitize_text(raw: str, max_chars: int = 4000) -> str:
     text = (raw or "").strip()[:max_chars]
     if not text:
         return ""
-    text = SECRET_PATTERN.sub(lambda m: f"{m.group(1)}=[REDACTED]", text)
-    text = DECLARED_PASSWORD_PATTERN.sub(lambda m: f"{m.group(1)} [REDACTED]", text)
-    text = LONG_TOKEN_PATTERN.sub("[REDACTED_TOKEN]", text)
+    # Literal prefilters: the key/value form needs ':' or '=' and the declared
+    # form needs the word "password", so plain chat text usually skips every
+    # regex. The passes still run in order on the previous pass's output.
+    if "=" in text or ":" in text:
+        text = SECRET_PATTERN.sub(lambda m: f"{m.group(1)}=[REDACTED]", text)
+    if "password" in text.casefold():
+        text = DECLARED_PASSWORD_PATTERN.sub(lambda m: f"{m.group(1)} [REDACTED]", text)
+    # Text shorter than LONG_TOKEN_MIN_CHARS cannot hold a long token.
+    if len(text) >= LONG_TOKEN_MIN_CHARS:
+        text = LONG_TOKEN_PATTERN.sub("[REDACTED_TOKEN]", text)
     return text
 
 
+def query_value(query: str, key: str, default: str = "") -> str:
+    # Same result as parse_qs(query).get(key, [default])[0] for plain keys,
+    # without building the dict of every parameter.
+    needle = key + "="
+    start = 0
+    while True:
+        index = query.find(needle, start)
+        if index < 0:
+            return default
+        end = query.find("&", index)
+        if end < 0:
+            end = len(query)
+        if (index == 0 or query[index - 1] == "&") and end > index + len(needle):
+            return unquote_plus(query[index + len(needle) : end])
+        start = index + 1
+
+
+_BOOL_STRINGS = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "y": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "n": False,
+    "off": False,
+}
+
+
 def parse_bool(value: Any, default: bool = False) -> bool:
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
+    if isinstance(value, str):
+        # Already-normalized values skip the strip/lower copies.
+        parsed = _BOOL_STRINGS.get(value)
+        if parsed is None:
+            parsed = _BOOL_STRINGS.get(value.strip().lower(), default)
+        return parsed
     if isinstance(value, (int, float)):
         return value != 0
-    if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"1", "true", "yes", "y", "on"}:
-            return True
-        if normalized in {"0", "false", "no", "n", "off"}:
-            return False
     return default
 
 
@@ -83,46 +226,179 @@ def parse_int(value: Any, default: int, minimum: int, maximum: int) -> int:
     return max(minimum, min(maximum, parsed))
 
 
+def copilot_route(value: Any) -> str:
+    # Routes are a closed set, so match the raw value directly; anything
+    # outside the set is dropped without running it through sanitize_text.
+    route = str(value or "").strip().upper()
+    return route if route in COPILOT_ALLOWED_ROUTES else ""
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
 def extract_first_json_object(raw: str) -> dict[str, Any] | None:
-    text = (raw or "").strip()
-    if not text:
+    text = raw or ""
+    # Model responses may include markdown wrappers or trailing prose, so
+    # decode the object that opens at the first "{". A later "{" is not
+    # tried: it could be a nested object of a malformed outer one.
+    start = text.find("{")
+    if start < 0:
         return None
-    # Model responses may include markdown wrappers, so extract the first JSON object.
-    if text.startswith("{") and text.endswith("}"):
-        candidate = text
-    else:
-        start = text.find("{")
-        end = text.rfind("}")
-        if start < 0 or end <= start:
-            return None
-        candidate = text[start : end + 1]
     try:
-        payload = json.loads(candidate)
+        payload, _end = _JSON_DECODER.raw_decode(text, start)
     except json.JSONDecodeError:
         return None
-    if not isinstance(payload, dict):
-        return None
-    return payload
+    return payload if isinstance(payload, dict) else None
 
 
 def load_json(path: Path, fallback: Any) -> Any:
     if not path.exists():
         return fallback
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_loads(path.read_bytes())
     except json.JSONDecodeError:
         return fallback
 
 
-def save_json(path: Path, payload: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+_json_file_cache: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+
+
+def load_json_cached(path: Path, fallback: Any) -> Any:
+    # For read-only callers: the parsed payload is shared between calls and is
+    # only re-read when the file's mtime/size/inode change.
+    try:
+        info = path.stat()
+    except OSError:
+        return fallback
+    key = (info.st_mtime_ns, info.st_size, info.st_ino)
+    cached = _json_file_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    payload = load_json(path, fallback)
+    _json_file_cache[path] = (key, payload)
+    return payload
 
 
 def append_jsonl(path: Path, payload: dict[str, Any]) -> None:
+    append_bytes(path, json_dumps_line(payload))
+
+
+def append_bytes(path: Path, data: bytes) -> None:
+    # Raw O_APPEND descriptor and a single write() for the whole buffer; no
+    # buffered file object per append.
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def _write_pending(writes: list[tuple[Path, bytes, bool]]) -> None:
+    for path, data, append in writes:
+        if append:
+            append_bytes(path, data)
+        else:
+            _atomic_write_bytes(path, data)
+
+
+def _iter_lines_reversed(path: Path, chunk_size: int = TAIL_READ_CHUNK_BYTES) -> Iterator[bytes]:
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            handle.seek(position)
+            lines = (handle.read(step) + remainder).split(b"\n")
+            # The first piece may continue in the previous chunk.
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+
+_static_cache: dict[Path, tuple[tuple[int, int], bytes, bytes]] = {}
+_static_cache_lock = threading.Lock()
+
+
+_http_date_cache: tuple[int, bytes] = (-1, b"")
+
+
+def http_date_header() -> bytes:
+    # Date header line, formatted once per second like now_iso().
+    global _http_date_cache
+    second = int(time.time())
+    cached_second, cached_line = _http_date_cache
+    if second == cached_second:
+        return cached_line
+    line = b"Date: %s\r\n" % email.utils.formatdate(second, usegmt=True).encode("ascii")
+    _http_date_cache = (second, line)
+    return line
+
+
+def _content_type_header(path: Path) -> bytes:
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return b"Content-Type: %s\r\n" % content_type.encode("latin-1")
+
+
+def _cached_static_file(path: Path, info: os.stat_result) -> tuple[bytes, bytes]:
+    key = (info.st_mtime_ns, info.st_size)
+    cached = _static_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+    body = path.read_bytes()
+    content_type = _content_type_header(path)
+    with _static_cache_lock:
+        _static_cache.pop(path, None)
+        if len(_static_cache) >= STATIC_CACHE_MAX_ENTRIES:
+            _static_cache.pop(next(iter(_static_cache)))
+        _static_cache[path] = (key, body, content_type)
+    return body, content_type
+
+
+def _etag_matches(if_none_match: str, etag: bytes) -> bool:
+    # Weak comparison per RFC 9110: "W/" prefixes are ignored.
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.encode("latin-1", "replace") == etag:
+            return True
+    return False
+
+
+def _max_id_sequence(rows: list[dict[str, Any]], key: str, prefix: str) -> int:
+    max_sequence = 0
+    for item in rows:
+        row_id = str(item.get(key, ""))
+        if not row_id.startswith(prefix):
+            continue
+        tail = row_id.split("-")[-1]
+        if tail.isdigit():
+            max_sequence = max(max_sequence, int(tail))
+    return max_sequence
 
 
 @dataclass
@@ -142,8 +418,22 @@ class SupportAiResponder:
             api_key=os.getenv("DT_SUPPORT_OPENAI_API_KEY", "").strip(),
             base_url=os.getenv("DT_SUPPORT_OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/"),
         )
-
-    def chat_reply(self, message: str, context: dict[str, Any] | None = None) -> str:
+        # One pooled session keeps TLS connections to the provider alive across
+        # calls. Keys differ per call (connected copilot), so auth stays per
+        # request and no cookies are carried between callers.
+        self._session = requests.Session()
+        self._session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=AI_REQUEST_RETRY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._call_slots = threading.BoundedSemaphore(AI_MAX_CONCURRENT_CALLS)
+
+    def chat_reply(
+        self,
+        message: str,
+        context: dict[str, Any] | None = None,
+        intents: frozenset[str] | None = None,
+    ) -> str:
         prompt = sanitize_text(message, max_chars=2000)
         if not prompt:
             return "Please share a short question so I can help."
@@ -160,7 +450,7 @@ class SupportAiResponder:
             if reply:
                 return reply
 
-        return self._fallback_chat_reply(prompt)
+        return self._fallback_chat_reply(prompt, chat_intents(prompt) if intents is None else intents)
 
     def ticket_triage_reply(self, ticket: dict[str, Any]) -> str:
         title = sanitize_text(ticket.get("title", ""), max_chars=300)
@@ -178,6 +468,7 @@ class SupportAiResponder:
                     f"Details: {details}\n"
                     "Return a concise first response with 1-4 actionable steps."
                 ),
+                slot_wait=AI_TRIAGE_SLOT_WAIT_SECONDS,
             )
             if reply:
                 return reply
@@ -187,7 +478,7 @@ class SupportAiResponder:
     def _openai_ready(self) -> bool:
         return self.config.provider == "openai" and bool(self.config.api_key)
 
-    def _openai_reply(self, system_prompt: str, user_prompt: str) -> str:
+    def _openai_reply(self, system_prompt: str, user_prompt: str, slot_wait: float | None = None) -> str:
         return self._openai_reply_with_credentials(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
@@ -195,6 +486,7 @@ class SupportAiResponder:
             model=self.config.model,
             max_tokens=350,
             temperature=0.2,
+            slot_wait=slot_wait,
         )
 
     def _openai_reply_with_credentials(
@@ -205,15 +497,22 @@ class SupportAiResponder:
         model: str,
         max_tokens: int = 350,
         temperature: float = 0.2,
+        slot_wait: float | None = None,
     ) -> str:
         if not api_key.strip():
             return ""
+        # Request paths do not queue behind a slow provider: with every slot
+        # busy they get "" right away and use their fallback reply. The triage
+        # worker passes slot_wait so a burst of chats cannot starve triage.
+        if slot_wait is None:
+            acquired = self._call_slots.acquire(blocking=False)
+        else:
+            acquired = self._call_slots.acquire(timeout=slot_wait)
+        if not acquired:
+            return ""
         try:
             url = f"{self.config.base_url}/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {api_key.strip()}",
-                "Content-Type": "application/json",
-            }
+            headers = {"Authorization": f"Bearer {api_key.strip()}"}
             payload = {
                 "model": model.strip(),
                 "temperature": max(0.0, min(1.0, float(temperature))),
@@ -223,9 +522,9 @@ class SupportAiResponder:
                     {"role": "user", "content": user_prompt},
                 ],
             }
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self._session.post(url, headers=headers, json=payload, timeout=AI_REQUEST_TIMEOUT)
             response.raise_for_status()
-            body = response.json()
+            body = json_loads(response.content)
             choices = body.get("choices") or []
             if not choices:
                 return ""
@@ -234,6 +533,8 @@ class SupportAiResponder:
             return sanitize_text(content, max_chars=2000)
         except Exception:
             return ""
+        finally:
+            self._call_slots.release()
 
     def connected_copilot_brief(
         self,
@@ -310,8 +611,8 @@ class SupportAiResponder:
         for item in actions_raw:
             if not isinstance(item, dict):
                 continue
-            route = sanitize_text(str(item.get("route", "")), max_chars=40).upper()
-            if route not in COPILOT_ALLOWED_ROUTES:
+            route = copilot_route(item.get("route"))
+            if not route:
                 continue
             title = sanitize_text(item.get("title", ""), max_chars=100)
             action_rationale = sanitize_text(item.get("rationale", ""), max_chars=240)
@@ -342,19 +643,18 @@ class SupportAiResponder:
             f"User message:\n{prompt}"
         )
 
-    def _fallback_chat_reply(self, prompt: str) -> str:
-        lowered = prompt.lower()
-        if "feature" in lowered or "add" in lowered:
+    def _fallback_chat_reply(self, prompt: str, intents: frozenset[str]) -> str:
+        if "feature" in intents or "add" in intents:
             return (
                 "Feature request noted. Please submit it through the request form so it enters the FIFO ticket queue. "
                 "Include expected behavior and why it improves daily workflow."
             )
-        if "bug" in lowered or "error" in lowered or "problem" in lowered or "issue" in lowered:
+        if "problem" in intents:
             return (
                 "I can help triage this. Please include device model, Android version, app version, and exact steps to reproduce. "
                 "Then submit through the problem report form so it is queued in order."
             )
-        if "price" in lowered or "billing" in lowered or "trial" in lowered:
+        if "billing" in intents:
             return (
                 "DT Guardian uses a 7-day trial and region-based subscription pricing. "
                 "Use the app's 'Choose plan' flow to view your local weekly/monthly/yearly amounts."
@@ -384,7 +684,83 @@ class SupportAiResponder:
 
 class SupportStore:
     def __init__(self) -> None:
+        # _lock guards tickets, the summary and pending writes; feedback has
+        # its own lock so submissions do not wait on ticket traffic. When both
+        # are needed, _lock is taken first.
         self._lock = threading.Lock()
+        self._feedback_lock = threading.Lock()
+        # The store owns the support state files while the hub runs: load them
+        # once and keep the in-memory copies authoritative, writing through on
+        # every mutation instead of re-reading the files per operation.
+        # Tickets are the tickets.json snapshot plus an append-only op log;
+        # the snapshot is rewritten every TICKET_SNAPSHOT_EVERY_OPS ops, once
+        # logged ops are TICKET_SNAPSHOT_MAX_AGE_SECONDS old, and on shutdown,
+        # after which the log is truncated.
+        self._ticket_log_ops = 0
+        self._ticket_snapshot_at = time.monotonic()
+        self._tickets = self._load_tickets()
+        self._tickets_by_id: dict[str, dict[str, Any]] = {}
+        self._queued: list[tuple[str, int, str]] = []
+        for position, item in enumerate(self._tickets):
+            ticket_id = str(item.get("ticket_id", ""))
+            self._tickets_by_id[ticket_id] = item
+            if item.get("status") == "queued":
+                self._queued.append((item.get("created_at", ""), position, ticket_id))
+        heapq.heapify(self._queued)
+        self._status_counts = Counter(item.get("status") for item in self._tickets)
+        # The triage worker sleeps on this until a ticket is queued or the
+        # queue is closed at shutdown.
+        self._queue_ready = threading.Condition(self._lock)
+        self._queue_closed = False
+        self._feedback = self._load_feedback()
+        self._ticket_sequence = _max_id_sequence(self._tickets, "ticket_id", "TKT-")
+        self._feedback_sequence = _max_id_sequence(self._feedback, "feedback_id", "FBK-")
+
+        # Mutations only mark state dirty; a flusher thread (when started) writes
+        # at most once per FLUSH_INTERVAL_SECONDS, batching JSONL events per file.
+        self._dirty_tickets = False
+        self._dirty_feedback = False
+        self._dirty_summary = False
+        self._pending_events: dict[Path, list[bytes]] = {}
+        # Request-thread events (access log) skip the store lock entirely.
+        self._event_queue: queue.SimpleQueue[tuple[Path, bytes]] = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._flush_wake = threading.Event()
+        self._flush_stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def start_flusher(self) -> None:
+        if self._flusher is not None:
+            return
+        self._flush_stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="support-store-flusher", daemon=True)
+        self._flusher.start()
+
+    def stop_flusher(self) -> None:
+        flusher = self._flusher
+        if flusher is not None:
+            self._flush_stop.set()
+            self._flush_wake.set()
+            flusher.join(timeout=2.0)
+            self._flusher = None
+        with self._lock:
+            if self._ticket_log_ops:
+                self._dirty_tickets = True
+        self.flush()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                writes = self._collect_pending_writes()
+            _write_pending(writes)
+
+    def log_event(self, path: Path, payload: dict[str, Any]) -> None:
+        line = json_dumps_line(payload)
+        if self._flusher is None:
+            _write_pending([(path, line, True)])
+            return
+        self._event_queue.put((path, line))
+        self._flush_wake.set()
 
     def create_ticket(
         self,
@@ -396,9 +772,8 @@ class SupportStore:
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         with self._lock:
-            tickets = self._load_tickets()
             created_at = now_iso()
-            ticket_id = self._next_ticket_id(tickets)
+            ticket_id = self._next_ticket_id()
             ticket = {
                 "ticket_id": ticket_id,
                 "type": ticket_type,
@@ -412,10 +787,14 @@ class SupportStore:
                 "triage_reply": "",
                 "metadata": metadata or {},
             }
-            tickets.append(ticket)
-            self._save_tickets(tickets)
-
-            append_jsonl(
+            heapq.heappush(self._queued, (created_at, len(self._tickets), ticket_id))
+            self._status_counts["queued"] += 1
+            self._queue_ready.notify()
+            self._tickets.append(ticket)
+            self._tickets_by_id[ticket_id] = ticket
+            self._log_ticket_op({"op": "create", **ticket})
+
+            self._queue_event(
                 SUPPORT_TICKET_EVENTS_PATH,
                 {
                     "event": "ticket_created",
@@ -425,72 +804,84 @@ class SupportStore:
                     "status": "queued",
                 },
             )
-            self._write_summary(tickets)
-            return ticket
+            self._mark_dirty()
+            return dict(ticket)
 
-    def reserve_next_queued(self) -> dict[str, Any] | None:
+    def close_queue(self) -> None:
         with self._lock:
-            tickets = self._load_tickets()
-            queued = sorted(
-                [item for item in tickets if item.get("status") == "queued"],
-                key=lambda item: item.get("created_at", ""),
-            )
-            if not queued:
-                return None
-            target_id = queued[0]["ticket_id"]
-            now = now_iso()
-            for item in tickets:
-                if item.get("ticket_id") == target_id:
-                    item["status"] = "in_progress"
-                    item["updated_at"] = now
-                    self._save_tickets(tickets)
-                    append_jsonl(
-                        SUPPORT_TICKET_EVENTS_PATH,
-                        {
-                            "event": "ticket_in_progress",
-                            "ticket_id": target_id,
-                            "timestamp": now,
-                        },
-                    )
-                    self._write_summary(tickets)
-                    return dict(item)
-            return None
+            self._queue_closed = True
+            self._queue_ready.notify_all()
 
-    def complete_ticket_triage(self, ticket_id: str, triage_reply: str) -> dict[str, Any] | None:
+    def reserve_next_queued(self, wait: bool = False) -> dict[str, Any] | None:
         with self._lock:
-            tickets = self._load_tickets()
-            now = now_iso()
-            for item in tickets:
-                if item.get("ticket_id") != ticket_id:
+            while wait and not self._queued and not self._queue_closed:
+                self._queue_ready.wait()
+            if wait and self._queue_closed:
+                return None
+            while self._queued:
+                _, _, target_id = heapq.heappop(self._queued)
+                item = self._tickets_by_id.get(target_id)
+                if item is None or item.get("status") != "queued":
                     continue
-                item["status"] = "triaged"
+                now = now_iso()
+                self._set_status(item, "in_progress")
                 item["updated_at"] = now
-                item["triage_reply"] = sanitize_text(triage_reply, max_chars=2000)
-                self._save_tickets(tickets)
-                append_jsonl(
+                self._log_ticket_op({"op": "status", "ticket_id": target_id, "status": "in_progress", "updated_at": now})
+                self._queue_event(
                     SUPPORT_TICKET_EVENTS_PATH,
                     {
-                        "event": "ticket_triaged",
-                        "ticket_id": ticket_id,
+                        "event": "ticket_in_progress",
+                        "ticket_id": target_id,
                         "timestamp": now,
                     },
                 )
-                self._write_summary(tickets)
+                self._mark_dirty()
                 return dict(item)
             return None
 
+    def complete_ticket_triage(self, ticket_id: str, triage_reply: str) -> dict[str, Any] | None:
+        with self._lock:
+            item = self._tickets_by_id.get(ticket_id)
+            if item is None:
+                return None
+            if item.get("status") == "queued":
+                self._queued = [entry for entry in self._queued if entry[2] != ticket_id]
+                heapq.heapify(self._queued)
+            now = now_iso()
+            self._set_status(item, "triaged")
+            item["updated_at"] = now
+            item["triage_reply"] = sanitize_text(triage_reply, max_chars=2000)
+            self._log_ticket_op(
+                {
+                    "op": "status",
+                    "ticket_id": ticket_id,
+                    "status": "triaged",
+                    "updated_at": now,
+                    "triage_reply": item["triage_reply"],
+                }
+            )
+            self._queue_event(
+                SUPPORT_TICKET_EVENTS_PATH,
+                {
+                    "event": "ticket_triaged",
+                    "ticket_id": ticket_id,
+                    "timestamp": now,
+                },
+            )
+            self._mark_dirty()
+            return dict(item)
+
     def list_tickets(self, status: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
         with self._lock:
-            tickets = self._load_tickets()
+            tickets = self._tickets
             if status:
                 tickets = [item for item in tickets if item.get("status") == status]
             tickets = sorted(tickets, key=lambda item: item.get("created_at", ""))
-            return tickets[: max(1, min(limit, 250))]
+            return [dict(item) for item in tickets[: max(1, min(limit, 250))]]
 
     def pending_count(self) -> int:
-        with self._lock:
-            tickets = self._load_tickets()
-            return sum(1 for item in tickets if item.get("status") == "queued")
+        # A single Counter read; no lock needed for a point-in-time count.
+        return self._status_counts["queued"]
 
     def append_chat(self, session_id: str, role: str, message: str, metadata: dict[str, Any] | None = None) -> None:
         payload = {
@@ -503,22 +894,31 @@ class SupportStore:
         append_jsonl(SUPPORT_CHAT_LOG_PATH, payload)
 
     def chat_history(self, session_id: str, limit: int = 20) -> list[dict[str, Any]]:
-        session = sanitize_text(session_id, max_chars=80)
+        # Callers pass the already sanitized id (the history route sanitizes
+        # the query value, append_chat sanitizes on write); no second regex pass.
+        session = (session_id or "").strip()[:80]
+        if not session:
+            return []
         if not SUPPORT_CHAT_LOG_PATH.exists():
             return []
+        limit = max(1, min(limit, 100))
+        # Cheap byte pre-check on the encoded value so most lines of other
+        # sessions are skipped without a json.loads. A non-ASCII id may be
+        # stored raw or \u-escaped depending on the writer, so it skips the
+        # pre-check (b"" is in every line).
+        needle = json_dumps(session) if session.isascii() else b""
         rows: list[dict[str, Any]] = []
-        lines = SUPPORT_CHAT_LOG_PATH.read_text(encoding="utf-8").splitlines()
-        for line in reversed(lines):
-            if not line.strip():
+        for line in _iter_lines_reversed(SUPPORT_CHAT_LOG_PATH):
+            if needle not in line:
                 continue
             try:
-                payload = json.loads(line)
+                payload = json_loads(line)
             except json.JSONDecodeError:
                 continue
-            if payload.get("session_id") != session:
+            if not isinstance(payload, dict) or payload.get("session_id") != session:
                 continue
             rows.append(payload)
-            if len(rows) >= max(1, min(limit, 100)):
+            if len(rows) >= limit:
                 break
         rows.reverse()
         return rows
@@ -530,10 +930,9 @@ class SupportStore:
         source: str,
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        with self._lock:
-            feedback_rows = self._load_feedback()
+        with self._feedback_lock:
             created_at = now_iso()
-            feedback_id = self._next_feedback_id(feedback_rows)
+            feedback_id = self._next_feedback_id()
             row = {
                 "feedback_id": feedback_id,
                 "rating": max(1, min(int(rating), 5)),
@@ -542,46 +941,73 @@ class SupportStore:
                 "created_at": created_at,
                 "metadata": metadata or {},
             }
-            feedback_rows.append(row)
-            self._save_feedback(feedback_rows)
-            append_jsonl(
+            self._feedback.append(row)
+            self._dirty_feedback = True
+        # Events go through the lock-free queue; only the dirty mark below
+        # touches the shared store lock.
+        self._event_queue.put(
+            (
                 SUPPORT_FEEDBACK_LOG_PATH,
-                {
-                    "event": "feedback_received",
-                    "timestamp": created_at,
-                    "feedback_id": feedback_id,
-                    "rating": row["rating"],
-                    "recommend_to_friends": row["recommend_to_friends"],
-                    "source": row["source"],
-                },
+                json_dumps_line(
+                    {
+                        "event": "feedback_received",
+                        "timestamp": created_at,
+                        "feedback_id": feedback_id,
+                        "rating": row["rating"],
+                        "recommend_to_friends": row["recommend_to_friends"],
+                        "source": row["source"],
+                    }
+                ),
             )
-            append_jsonl(
+        )
+        self._event_queue.put(
+            (
                 SUPPORT_TICKET_EVENTS_PATH,
-                {
-                    "event": "feedback_received",
-                    "timestamp": created_at,
-                    "feedback_id": feedback_id,
-                    "rating": row["rating"],
-                    "recommend_to_friends": row["recommend_to_friends"],
-                },
+                json_dumps_line(
+                    {
+                        "event": "feedback_received",
+                        "timestamp": created_at,
+                        "feedback_id": feedback_id,
+                        "rating": row["rating"],
+                        "recommend_to_friends": row["recommend_to_friends"],
+                    }
+                ),
             )
-            self._write_summary(self._load_tickets())
-            return row
+        )
+        with self._lock:
+            self._mark_dirty()
+        return dict(row)
 
     def list_feedback(self, limit: int = 100) -> list[dict[str, Any]]:
-        with self._lock:
-            rows = self._load_feedback()
-            rows = sorted(rows, key=lambda item: item.get("created_at", ""))
-            return rows[: max(1, min(limit, 500))]
+        with self._feedback_lock:
+            rows = sorted(self._feedback, key=lambda item: item.get("created_at", ""))
+            return [dict(item) for item in rows[: max(1, min(limit, 500))]]
 
     def _load_tickets(self) -> list[dict[str, Any]]:
         data = load_json(SUPPORT_TICKETS_PATH, [])
-        if isinstance(data, list):
-            return data
-        return []
-
-    def _save_tickets(self, tickets: list[dict[str, Any]]) -> None:
-        save_json(SUPPORT_TICKETS_PATH, tickets)
+        tickets: list[dict[str, Any]] = data if isinstance(data, list) else []
+        if not SUPPORT_TICKETS_LOG_PATH.exists():
+            return tickets
+        by_id = {str(item.get("ticket_id", "")): item for item in tickets}
+        with SUPPORT_TICKETS_LOG_PATH.open("rb") as handle:
+            for line in handle:
+                try:
+                    op = json_loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(op, dict):
+                    continue
+                self._ticket_log_ops += 1
+                ticket_id = str(op.get("ticket_id", ""))
+                if op.get("op") == "create":
+                    # A crash between snapshot and truncation can replay creates.
+                    if ticket_id not in by_id:
+                        ticket = {key: value for key, value in op.items() if key != "op"}
+                        by_id[ticket_id] = ticket
+                        tickets.append(ticket)
+                elif op.get("op") == "status" and ticket_id in by_id:
+                    by_id[ticket_id].update({key: value for key, value in op.items() if key not in {"op", "ticket_id"}})
+        return tickets
 
     def _load_feedback(self) -> list[dict[str, Any]]:
         data = load_json(SUPPORT_FEEDBACK_PATH, [])
@@ -589,47 +1015,108 @@ class SupportStore:
             return data
         return []
 
-    def _save_feedback(self, rows: list[dict[str, Any]]) -> None:
-        save_json(SUPPORT_FEEDBACK_PATH, rows)
-
-    def _next_ticket_id(self, tickets: list[dict[str, Any]]) -> str:
-        max_sequence = 0
-        for item in tickets:
-            ticket_id = str(item.get("ticket_id", ""))
-            if not ticket_id.startswith("TKT-"):
-                continue
-            tail = ticket_id.split("-")[-1]
-            if tail.isdigit():
-                max_sequence = max(max_sequence, int(tail))
-        return f"TKT-{max_sequence + 1:06d}"
-
-    def _next_feedback_id(self, rows: list[dict[str, Any]]) -> str:
-        max_sequence = 0
-        for item in rows:
-            feedback_id = str(item.get("feedback_id", ""))
-            if not feedback_id.startswith("FBK-"):
-                continue
-            tail = feedback_id.split("-")[-1]
-            if tail.isdigit():
-                max_sequence = max(max_sequence, int(tail))
-        return f"FBK-{max_sequence + 1:06d}"
-
-    def _write_summary(self, tickets: list[dict[str, Any]]) -> None:
-        feedback_rows = self._load_feedback()
-        summary = {
+    def _next_ticket_id(self) -> str:
+        # Caller holds self._lock.
+        self._ticket_sequence += 1
+        return f"TKT-{self._ticket_sequence:06d}"
+
+    def _next_feedback_id(self) -> str:
+        # Caller holds self._feedback_lock.
+        self._feedback_sequence += 1
+        return f"FBK-{self._feedback_sequence:06d}"
+
+    def _set_status(self, item: dict[str, Any], status: str) -> None:
+        self._status_counts[item.get("status")] -= 1
+        self._status_counts[status] += 1
+        item["status"] = status
+
+    def _build_summary(self) -> dict[str, Any]:
+        # Counts are kept per mutation and the heap orders queued tickets by
+        # (created_at, position), matching the old stable sort by created_at.
+        oldest_queued_id = ""
+        if self._queued:
+            head_id = self._queued[0][2]
+            if self._tickets_by_id.get(head_id, {}).get("status") == "queued":
+                oldest_queued_id = head_id
+        return {
             "updated_at": now_iso(),
             "counts": {
-                "queued": sum(1 for item in tickets if item.get("status") == "queued"),
-                "in_progress": sum(1 for item in tickets if item.get("status") == "in_progress"),
-                "triaged": sum(1 for item in tickets if item.get("status") == "triaged"),
-                "feedback": len(feedback_rows),
+                "queued": self._status_counts["queued"],
+                "in_progress": self._status_counts["in_progress"],
+                "triaged": self._status_counts["triaged"],
+                "feedback": len(self._feedback),
             },
-            "oldest_queued_ticket_id": next(
-                (item.get("ticket_id") for item in sorted(tickets, key=lambda x: x.get("created_at", "")) if item.get("status") == "queued"),
-                "",
-            ),
+            "oldest_queued_ticket_id": oldest_queued_id,
         }
-        save_json(SUPPORT_SUMMARY_PATH, summary)
+
+    def _queue_event(self, path: Path, payload: dict[str, Any]) -> None:
+        self._pending_events.setdefault(path, []).append(json_dumps_line(payload))
+
+    def _log_ticket_op(self, op: dict[str, Any]) -> None:
+        # Caller holds self._lock.
+        self._queue_event(SUPPORT_TICKETS_LOG_PATH, op)
+        self._ticket_log_ops += 1
+        if self._ticket_log_ops >= TICKET_SNAPSHOT_EVERY_OPS:
+            self._dirty_tickets = True
+
+    def _mark_dirty(self) -> None:
+        # Caller holds self._lock.
+        self._dirty_summary = True
+        if self._flusher is None:
+            _write_pending(self._collect_pending_writes())
+        else:
+            self._flush_wake.set()
+
+    def _collect_pending_writes(self) -> list[tuple[Path, bytes, bool]]:
+        # Caller holds self._lock; serialize now so the write can happen unlocked.
+        writes: list[tuple[Path, bytes, bool]] = []
+        if (
+            self._ticket_log_ops
+            and time.monotonic() - self._ticket_snapshot_at >= TICKET_SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            self._dirty_tickets = True
+        if self._dirty_tickets:
+            # The snapshot covers every logged op, so pending log lines are
+            # dropped and the log is truncated right after the snapshot lands.
+            # Snapshots are rare, so tickets.json stays indented for readers.
+            writes.append((SUPPORT_TICKETS_PATH, json_dumps(self._tickets, indent=True), False))
+            writes.append((SUPPORT_TICKETS_LOG_PATH, b"", False))
+            self._pending_events.pop(SUPPORT_TICKETS_LOG_PATH, None)
+            self._ticket_log_ops = 0
+            self._ticket_snapshot_at = time.monotonic()
+            self._dirty_tickets = False
+        with self._feedback_lock:
+            if self._dirty_feedback:
+                writes.append((SUPPORT_FEEDBACK_PATH, json_dumps(self._feedback), False))
+                self._dirty_feedback = False
+        if self._dirty_summary:
+            writes.append((SUPPORT_SUMMARY_PATH, json_dumps(self._build_summary()), False))
+            self._dirty_summary = False
+        while True:
+            try:
+                path, line = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_events.setdefault(path, []).append(line)
+        for path, lines in self._pending_events.items():
+            writes.append((path, b"".join(lines), True))
+        self._pending_events = {}
+        return writes
+
+    def _flush_loop(self) -> None:
+        while True:
+            # The timeout lets aged ticket ops reach a snapshot on a quiet hub.
+            self._flush_wake.wait(TICKET_SNAPSHOT_MAX_AGE_SECONDS)
+            if self._flush_stop.is_set():
+                break
+            # Give a burst of mutations a moment to coalesce into one write.
+            time.sleep(FLUSH_INTERVAL_SECONDS)
+            # A stop that arrived during the sleep must not have its wake
+            # cleared; stop_flusher runs the final flush itself.
+            if self._flush_stop.is_set():
+                break
+            self._flush_wake.clear()
+            self.flush()
 
 
 class SupportHub:
@@ -637,20 +1124,19 @@ class SupportHub:
         self.store = SupportStore()
         self.ai = SupportAiResponder()
         self.device_umbrella = DeviceUmbrellaStore()
-        self.stop_event = threading.Event()
-        self._wake = threading.Event()
         self.worker = threading.Thread(target=self._worker_loop, name="support-ticket-worker", daemon=True)
+        # (settings object, policy): load_json_cached hands back the same
+        # object until the settings file changes, so identity is the key.
+        self._policy_cache: tuple[Any, dict[str, Any]] | None = None
 
     def start(self) -> None:
+        self.store.start_flusher()
         self.worker.start()
 
     def stop(self) -> None:
-        self.stop_event.set()
-        self._wake.set()
+        self.store.close_queue()
         self.worker.join(timeout=2.0)
-
-    def wake_worker(self) -> None:
-        self._wake.set()
+        self.store.stop_flusher()
 
     def create_ticket(self, payload: dict[str, Any], ticket_type: str) -> dict[str, Any]:
         ticket = self.store.create_ticket(
@@ -661,7 +1147,6 @@ class SupportHub:
             source=payload.get("source", "support_web"),
             metadata={"client": sanitize_text(payload.get("client", ""), max_chars=120)},
         )
-        self.wake_worker()
         return ticket
 
     def handle_chat(self, payload: dict[str, Any]) -> dict[str, Any]:
@@ -674,14 +1159,13 @@ class SupportHub:
         region = sanitize_text(payload.get("region", ""), max_chars=16) or "unknown"
         self.store.append_chat(session_id, "user", message, metadata={"region": region})
 
-        reply = self.ai.chat_reply(message, context={"pending_tickets": pending, "region": region})
+        intents = chat_intents(message)
+        reply = self.ai.chat_reply(message, context={"pending_tickets": pending, "region": region}, intents=intents)
         self.store.append_chat(session_id, "assistant", reply)
 
         auto_ticket_id = ""
-        lowered = message.lower()
-        should_create_ticket = any(token in lowered for token in ("feature request", "bug", "problem report", "open ticket"))
-        if should_create_ticket:
-            ticket_type = "feature_request" if "feature" in lowered else "problem_report"
+        if "ticket" in intents:
+            ticket_type = "feature_request" if "feature" in intents else "problem_report"
             ticket = self.store.create_ticket(
                 ticket_type=ticket_type,
                 title=(message[:100] or f"chat_{ticket_type}"),
@@ -691,12 +1175,11 @@ class SupportHub:
                 metadata={"session_id": session_id},
             )
             auto_ticket_id = ticket["ticket_id"]
-            self.wake_worker()
 
         return {"session_id": session_id, "reply": reply, "ticket_id": auto_ticket_id}
 
     def health(self) -> dict[str, Any]:
-        summary = load_json(SUPPORT_SUMMARY_PATH, {})
+        summary = load_json_cached(SUPPORT_SUMMARY_PATH, {})
         connected_policy = self._connected_ai_policy()
         return {
             "status": "ok",
@@ -736,7 +1219,7 @@ class SupportHub:
             metadata=metadata,
         )
 
-        settings = load_json(SETTINGS_PATH, {})
+        settings = load_json_cached(SETTINGS_PATH, {})
         default_create_ticket = parse_bool(
             settings.get("support", {}).get("feedback", {}).get("create_ticket_for_feedback"),
             default=True,
@@ -763,7 +1246,6 @@ class SupportHub:
                 },
             )
             ticket_id = ticket["ticket_id"]
-            self.wake_worker()
 
         return {
             "feedback": feedback,
@@ -853,7 +1335,15 @@ class SupportHub:
         }
 
     def _connected_ai_policy(self) -> dict[str, Any]:
-        settings = load_json(SETTINGS_PATH, {})
+        settings = load_json_cached(SETTINGS_PATH, {})
+        cached = self._policy_cache
+        if cached is not None and cached[0] is settings:
+            return cached[1]
+        policy = self._build_connected_ai_policy(settings)
+        self._policy_cache = (settings, policy)
+        return policy
+
+    def _build_connected_ai_policy(self, settings: Any) -> dict[str, Any]:
         copilot = settings.get("copilot", {}) if isinstance(settings, dict) else {}
         connected = copilot.get("connected_ai", {}) if isinstance(copilot, dict) else {}
 
@@ -894,6 +1384,7 @@ class SupportHub:
     ) -> list[str]:
         if not isinstance(raw_values, list):
             return defaults
+        seen: set[str] = set()
         values: list[str] = []
         for item in raw_values:
             if not isinstance(item, str):
@@ -903,9 +1394,11 @@ class SupportHub:
                 continue
             if lowercase:
                 sanitized = sanitized.lower()
+            if sanitized in seen:
+                continue
+            seen.add(sanitized)
             values.append(sanitized)
-        deduped = list(dict.fromkeys(values))
-        return deduped or defaults
+        return values or defaults
 
     def _sanitize_copilot_actions(self, raw_actions: Any, max_actions: int) -> list[dict[str, str]]:
         actions: list[dict[str, str]] = []
@@ -913,8 +1406,8 @@ class SupportHub:
             for item in raw_actions:
                 if not isinstance(item, dict):
                     continue
-                route = sanitize_text(item.get("route", ""), max_chars=40).upper()
-                if route not in COPILOT_ALLOWED_ROUTES:
+                route = copilot_route(item.get("route"))
+                if not route:
                     continue
                 title = sanitize_text(item.get("title", ""), max_chars=100)
                 rationale = sanitize_text(item.get("rationale", ""), max_chars=240)
@@ -931,29 +1424,26 @@ class SupportHub:
                     break
         if actions:
             return actions
-        return [
-            {
-                "title": "Run one-time scan now",
-                "rationale": "Refresh local evidence before additional sensitive actions.",
-                "route": "RUN_ONE_TIME_SCAN",
-            }
-        ]
+        return [dict(item) for item in DEFAULT_COPILOT_ACTIONS]
 
     def _worker_loop(self) -> None:
         # Backlog worker: process queued tickets in strict FIFO order.
-        while not self.stop_event.is_set():
-            ticket = self.store.reserve_next_queued()
+        while True:
+            ticket = self.store.reserve_next_queued(wait=True)
             if ticket is None:
-                self._wake.wait(timeout=2.0)
-                self._wake.clear()
-                continue
-
+                return
             triage = self.ai.ticket_triage_reply(ticket)
             self.store.complete_ticket_triage(ticket["ticket_id"], triage)
 
 
 class SupportHttpHandler(BaseHTTPRequestHandler):
     protocol_version = "HTTP/1.1"
+    timeout = HTTP_IDLE_TIMEOUT_SECONDS
+    # Responses are a single write, so Nagle only adds delay on keep-alive.
+    disable_nagle_algorithm = True
+    server_header = (
+        f"Server: {BaseHTTPRequestHandler.server_version} {BaseHTTPRequestHandler.sys_version}\r\n".encode("latin-1")
+    )
 
     @property
     def hub(self) -> SupportHub:
@@ -963,13 +1453,31 @@ class SupportHttpHandler(BaseHTTPRequestHandler):
     def docs_root(self) -> Path:
         return self.server.docs_root  # type: ignore[attr-defined]
 
+    def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+        # Per-request fast path: no "%" formatting; sanitize_text has its own
+        # cheap prefilter. The query string, where client values live, is not
+        # logged.
+        if isinstance(code, HTTPStatus):
+            code = code.value
+        path = sanitize_text(getattr(self, "path", "").split("?", 1)[0], max_chars=300)
+        self.hub.store.log_event(
+            SUPPORT_TICKET_EVENTS_PATH,
+            {
+                "event": "http_access",
+                "timestamp": now_iso(),
+                "method": self.command or "",
+                "path": path,
+                "status": code,
+            },
+        )
+
     def log_message(self, format: str, *args: Any) -> None:
-        append_jsonl(
+        self.hub.store.log_event(
             SUPPORT_TICKET_EVENTS_PATH,
             {
                 "event": "http_access",
                 "timestamp": now_iso(),
-                "path": sanitize_text(self.path, max_chars=300),
+                "path": sanitize_text(getattr(self, "path", ""), max_chars=300),
                 "message": sanitize_text(format % args, max_chars=300),
             },
         )
@@ -979,73 +1487,11 @@ class SupportHttpHandler(BaseHTTPRequestHandler):
 
     def do_GET(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
-        if parsed.path == "/api/support/health":
-            self._send_json(HTTPStatus.OK, self.hub.health())
-            return
-        if parsed.path == "/api/support/tickets":
-            params = parse_qs(parsed.query)
-            status = sanitize_text(params.get("status", [""])[0], max_chars=40) or None
-            try:
-                limit = int(params.get("limit", ["50"])[0])
-            except ValueError:
-                limit = 50
-            tickets = self.hub.store.list_tickets(status=status, limit=limit)
-            self._send_json(HTTPStatus.OK, {"tickets": tickets})
-            return
-        if parsed.path == "/api/support/chat/history":
-            params = parse_qs(parsed.query)
-            session_id = sanitize_text(params.get("session_id", [""])[0], max_chars=80)
-            if not session_id:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": "session_id is required"})
-                return
-            history = self.hub.store.chat_history(session_id=session_id, limit=40)
-            self._send_json(HTTPStatus.OK, {"session_id": session_id, "history": history})
-            return
-        if parsed.path == "/api/support/feedback":
-            params = parse_qs(parsed.query)
-            try:
-                limit = int(params.get("limit", ["100"])[0])
-            except ValueError:
-                limit = 100
-            rows = self.hub.store.list_feedback(limit=limit)
-            self._send_json(HTTPStatus.OK, {"feedback": rows})
-            return
-        if parsed.path == "/api/support/device-umbrella/session/status":
-            params = parse_qs(parsed.query)
-            session_id = sanitize_text(params.get("session_id", [""])[0], max_chars=80)
-            member_id = sanitize_text(params.get("member_id", [""])[0], max_chars=80)
-            if not session_id or not member_id:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": "session_id and member_id are required"})
-                return
-            try:
-                status = self.hub.device_umbrella.session_status(
-                    session_id=session_id,
-                    member_id=member_id,
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.OK, status)
-            return
-        if parsed.path == "/api/support/device-umbrella/session/join-requests":
-            params = parse_qs(parsed.query)
-            session_id = sanitize_text(params.get("session_id", [""])[0], max_chars=80)
-            member_id = sanitize_text(params.get("member_id", [""])[0], max_chars=80)
-            if not session_id or not member_id:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": "session_id and member_id are required"})
-                return
-            try:
-                status = self.hub.device_umbrella.list_join_requests(
-                    session_id=session_id,
-                    member_id=member_id,
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.OK, status)
+        route = self._GET_ROUTES.get(parsed.path)
+        if route is None:
+            self._serve_static(parsed.path)
             return
-
-        self._serve_static(parsed.path)
+        route(self, parsed.query)
 
     def do_POST(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
@@ -1053,152 +1499,253 @@ class SupportHttpHandler(BaseHTTPRequestHandler):
         if payload is None:
             self._send_json(HTTPStatus.BAD_REQUEST, {"error": "invalid json payload"})
             return
+        route = self._POST_ROUTES.get(parsed.path)
+        if route is None:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "endpoint not found"})
+            return
+        route(self, parsed.path, payload)
 
-        if parsed.path == "/api/support/device-umbrella/session/create":
-            try:
-                result = self.hub.device_umbrella.create_session(
-                    owner=payload.get("owner", ""),
-                    owner_proof=payload.get("owner_proof", ""),
-                    device_fingerprint=payload.get("device_fingerprint", ""),
-                    device_alias=payload.get("device_alias", ""),
-                    device_model=payload.get("device_model", ""),
-                    ttl_seconds=payload.get("ttl_seconds", 900),
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.CREATED, result)
+    def _get_health(self, query: str) -> None:
+        self._send_json(HTTPStatus.OK, self.hub.health())
+
+    def _get_tickets(self, query: str) -> None:
+        status = sanitize_text(query_value(query, "status"), max_chars=40) or None
+        try:
+            limit = int(query_value(query, "limit", "50"))
+        except ValueError:
+            limit = 50
+        tickets = self.hub.store.list_tickets(status=status, limit=limit)
+        self._send_json(HTTPStatus.OK, {"tickets": tickets})
+
+    def _get_chat_history(self, query: str) -> None:
+        session_id = sanitize_text(query_value(query, "session_id"), max_chars=80)
+        if not session_id:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "session_id is required"})
             return
+        history = self.hub.store.chat_history(session_id=session_id, limit=40)
+        self._send_json(HTTPStatus.OK, {"session_id": session_id, "history": history})
 
-        if parsed.path == "/api/support/device-umbrella/session/register-code":
-            try:
-                result = self.hub.device_umbrella.register_code(
-                    session_id=payload.get("session_id", ""),
-                    member_id=payload.get("member_id", ""),
-                    code_hash=payload.get("code_hash", ""),
-                    owner_proof=payload.get("owner_proof", ""),
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.OK, result)
+    def _get_feedback(self, query: str) -> None:
+        try:
+            limit = int(query_value(query, "limit", "100"))
+        except ValueError:
+            limit = 100
+        rows = self.hub.store.list_feedback(limit=limit)
+        self._send_json(HTTPStatus.OK, {"feedback": rows})
+
+    def _get_umbrella_session_status(self, query: str) -> None:
+        session_id = sanitize_text(query_value(query, "session_id"), max_chars=80)
+        member_id = sanitize_text(query_value(query, "member_id"), max_chars=80)
+        if not session_id or not member_id:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "session_id and member_id are required"})
+            return
+        try:
+            status = self.hub.device_umbrella.session_status(
+                session_id=session_id,
+                member_id=member_id,
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
             return
+        self._send_json(HTTPStatus.OK, status)
 
-        if parsed.path == "/api/support/device-umbrella/session/join":
-            try:
-                result = self.hub.device_umbrella.join_with_code(
-                    link_code=payload.get("link_code", ""),
-                    owner_proof=payload.get("owner_proof", ""),
-                    device_fingerprint=payload.get("device_fingerprint", ""),
-                    device_alias=payload.get("device_alias", ""),
-                    device_model=payload.get("device_model", ""),
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.OK, result)
+    def _get_umbrella_join_requests(self, query: str) -> None:
+        session_id = sanitize_text(query_value(query, "session_id"), max_chars=80)
+        member_id = sanitize_text(query_value(query, "member_id"), max_chars=80)
+        if not session_id or not member_id:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "session_id and member_id are required"})
             return
-        if parsed.path == "/api/support/device-umbrella/session/join-decision":
-            try:
-                result = self.hub.device_umbrella.decide_join_request(
-                    session_id=payload.get("session_id", ""),
-                    member_id=payload.get("member_id", ""),
-                    request_id=payload.get("request_id", ""),
-                    decision=payload.get("decision", ""),
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.OK, result)
+        try:
+            status = self.hub.device_umbrella.list_join_requests(
+                session_id=session_id,
+                member_id=member_id,
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
             return
+        self._send_json(HTTPStatus.OK, status)
 
-        if parsed.path == "/api/support/device-umbrella/sync/push":
-            try:
-                result = self.hub.device_umbrella.push_envelope(
-                    session_id=payload.get("session_id", ""),
-                    member_id=payload.get("member_id", ""),
-                    payload_version=parse_int(payload.get("payload_version"), default=1, minimum=1, maximum=9),
-                    iv_b64=payload.get("iv_b64", ""),
-                    ciphertext_b64=payload.get("ciphertext_b64", ""),
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.OK, result)
+    def _post_umbrella_session_create(self, path: str, payload: dict[str, Any]) -> None:
+        try:
+            result = self.hub.device_umbrella.create_session(
+                owner=payload.get("owner", ""),
+                owner_proof=payload.get("owner_proof", ""),
+                device_fingerprint=payload.get("device_fingerprint", ""),
+                device_alias=payload.get("device_alias", ""),
+                device_model=payload.get("device_model", ""),
+                ttl_seconds=payload.get("ttl_seconds", 900),
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
             return
+        self._send_json(HTTPStatus.CREATED, result)
 
-        if parsed.path == "/api/support/device-umbrella/sync/pull":
-            try:
-                result = self.hub.device_umbrella.pull_envelopes(
-                    session_id=payload.get("session_id", ""),
-                    member_id=payload.get("member_id", ""),
-                )
-            except ValueError as exc:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
-                return
-            self._send_json(HTTPStatus.OK, result)
+    def _post_umbrella_register_code(self, path: str, payload: dict[str, Any]) -> None:
+        try:
+            result = self.hub.device_umbrella.register_code(
+                session_id=payload.get("session_id", ""),
+                member_id=payload.get("member_id", ""),
+                code_hash=payload.get("code_hash", ""),
+                owner_proof=payload.get("owner_proof", ""),
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
             return
+        self._send_json(HTTPStatus.OK, result)
 
-        if parsed.path == "/api/support/chat":
-            result = self.hub.handle_chat(payload)
-            self._send_json(HTTPStatus.OK, result)
+    def _post_umbrella_join(self, path: str, payload: dict[str, Any]) -> None:
+        try:
+            result = self.hub.device_umbrella.join_with_code(
+                link_code=payload.get("link_code", ""),
+                owner_proof=payload.get("owner_proof", ""),
+                device_fingerprint=payload.get("device_fingerprint", ""),
+                device_alias=payload.get("device_alias", ""),
+                device_model=payload.get("device_model", ""),
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
             return
-        if parsed.path == "/api/support/copilot/brief":
-            auth_token = self._read_bearer_token()
-            result = self.hub.handle_copilot_brief(payload, auth_token=auth_token)
-            self._send_json(HTTPStatus.OK, result)
+        self._send_json(HTTPStatus.OK, result)
+
+    def _post_umbrella_join_decision(self, path: str, payload: dict[str, Any]) -> None:
+        try:
+            result = self.hub.device_umbrella.decide_join_request(
+                session_id=payload.get("session_id", ""),
+                member_id=payload.get("member_id", ""),
+                request_id=payload.get("request_id", ""),
+                decision=payload.get("decision", ""),
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
             return
-        if parsed.path == "/api/support/feedback":
-            result = self.hub.handle_feedback(payload)
-            if result.get("error"):
-                self._send_json(HTTPStatus.BAD_REQUEST, result)
-                return
-            self._send_json(HTTPStatus.CREATED, result)
+        self._send_json(HTTPStatus.OK, result)
+
+    def _post_umbrella_sync_push(self, path: str, payload: dict[str, Any]) -> None:
+        try:
+            result = self.hub.device_umbrella.push_envelope(
+                session_id=payload.get("session_id", ""),
+                member_id=payload.get("member_id", ""),
+                payload_version=parse_int(payload.get("payload_version"), default=1, minimum=1, maximum=9),
+                iv_b64=payload.get("iv_b64", ""),
+                ciphertext_b64=payload.get("ciphertext_b64", ""),
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
             return
+        self._send_json(HTTPStatus.OK, result)
 
-        if parsed.path in {"/api/support/tickets", "/api/support/feature-request", "/api/support/problem-report"}:
-            ticket_type = payload.get("type", "")
-            if parsed.path.endswith("/feature-request"):
-                ticket_type = "feature_request"
-            elif parsed.path.endswith("/problem-report"):
-                ticket_type = "problem_report"
-            ticket_type = sanitize_text(ticket_type or "general", max_chars=40) or "general"
-
-            title = sanitize_text(payload.get("title", ""), max_chars=300)
-            details = sanitize_text(payload.get("details", ""), max_chars=2000)
-            if not title or not details:
-                self._send_json(HTTPStatus.BAD_REQUEST, {"error": "title and details are required"})
-                return
+    def _post_umbrella_sync_pull(self, path: str, payload: dict[str, Any]) -> None:
+        try:
+            result = self.hub.device_umbrella.pull_envelopes(
+                session_id=payload.get("session_id", ""),
+                member_id=payload.get("member_id", ""),
+            )
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        self._send_json(HTTPStatus.OK, result)
+
+    def _post_chat(self, path: str, payload: dict[str, Any]) -> None:
+        result = self.hub.handle_chat(payload)
+        self._send_json(HTTPStatus.OK, result)
+
+    def _post_copilot_brief(self, path: str, payload: dict[str, Any]) -> None:
+        auth_token = self._read_bearer_token()
+        result = self.hub.handle_copilot_brief(payload, auth_token=auth_token)
+        self._send_json(HTTPStatus.OK, result)
 
-            ticket = self.hub.create_ticket(payload, ticket_type=ticket_type)
-            self._send_json(HTTPStatus.CREATED, {"ticket": ticket})
+    def _post_feedback(self, path: str, payload: dict[str, Any]) -> None:
+        result = self.hub.handle_feedback(payload)
+        if result.get("error"):
+            self._send_json(HTTPStatus.BAD_REQUEST, result)
+            return
+        self._send_json(HTTPStatus.CREATED, result)
+
+    def _post_ticket(self, path: str, payload: dict[str, Any]) -> None:
+        ticket_type = payload.get("type", "")
+        if path.endswith("/feature-request"):
+            ticket_type = "feature_request"
+        elif path.endswith("/problem-report"):
+            ticket_type = "problem_report"
+        ticket_type = sanitize_text(ticket_type or "general", max_chars=40) or "general"
+
+        title = sanitize_text(payload.get("title", ""), max_chars=300)
+        details = sanitize_text(payload.get("details", ""), max_chars=2000)
+        if not title or not details:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "title and details are required"})
             return
 
-        self._send_json(HTTPStatus.NOT_FOUND, {"error": "endpoint not found"})
+        ticket = self.hub.create_ticket(payload, ticket_type=ticket_type)
+        self._send_json(HTTPStatus.CREATED, {"ticket": ticket})
+
+    # Exact-path dispatch; GET paths not listed here fall through to static files.
+    _GET_ROUTES: dict[str, Callable[..., None]] = {
+        "/api/support/health": _get_health,
+        "/api/support/tickets": _get_tickets,
+        "/api/support/chat/history": _get_chat_history,
+        "/api/support/feedback": _get_feedback,
+        "/api/support/device-umbrella/session/status": _get_umbrella_session_status,
+        "/api/support/device-umbrella/session/join-requests": _get_umbrella_join_requests,
+    }
+    _POST_ROUTES: dict[str, Callable[..., None]] = {
+        "/api/support/device-umbrella/session/create": _post_umbrella_session_create,
+        "/api/support/device-umbrella/session/register-code": _post_umbrella_register_code,
+        "/api/support/device-umbrella/session/join": _post_umbrella_join,
+        "/api/support/device-umbrella/session/join-decision": _post_umbrella_join_decision,
+        "/api/support/device-umbrella/sync/push": _post_umbrella_sync_push,
+        "/api/support/device-umbrella/sync/pull": _post_umbrella_sync_pull,
+        "/api/support/chat": _post_chat,
+        "/api/support/copilot/brief": _post_copilot_brief,
+        "/api/support/feedback": _post_feedback,
+        "/api/support/tickets": _post_ticket,
+        "/api/support/feature-request": _post_ticket,
+        "/api/support/problem-report": _post_ticket,
+    }
 
     def _serve_static(self, raw_path: str) -> None:
-        if raw_path in {"", "/"}:
-            relative = Path("index.html")
-        else:
-            relative = Path(raw_path.lstrip("/"))
-
-        candidate = (self.docs_root / relative).resolve()
-        docs_root_resolved = self.docs_root.resolve()
-        if docs_root_resolved not in candidate.parents and candidate != docs_root_resolved:
+        relative = "index.html" if raw_path in {"", "/"} else raw_path.lstrip("/")
+        # The server resolved docs_root once at start-up; containment is a
+        # string prefix test on the resolved candidate.
+        server: Any = self.server
+        candidate_str = os.path.realpath(os.path.join(server.docs_root_str, relative))
+        if candidate_str != server.docs_root_str and not candidate_str.startswith(server.docs_root_prefix):
             self._send_text(HTTPStatus.FORBIDDEN, "forbidden")
             return
-        if not candidate.exists() or not candidate.is_file():
+        candidate = Path(candidate_str)
+        try:
+            info = os.stat(candidate_str)
+        except OSError:
+            info = None
+        if info is None or not stat.S_ISREG(info.st_mode):
             self._send_text(HTTPStatus.NOT_FOUND, "not found")
             return
 
-        content_type = mimetypes.guess_type(candidate.name)[0] or "application/octet-stream"
-        body = candidate.read_bytes()
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", str(len(body)))
-        self._send_cors_headers()
-        self.end_headers()
-        self.wfile.write(body)
+        # Validator from the stat we already have; a matching conditional GET
+        # is answered without touching the file contents.
+        etag = b'"%x-%x"' % (info.st_size, info.st_mtime_ns)
+        etag_header = b"ETag: " + etag + b"\r\n"
+        if _etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self._buffer_head(HTTPStatus.NOT_MODIFIED, etag_header, None)
+            self.flush_headers()
+            return
+
+        if info.st_size <= STATIC_CACHE_MAX_FILE_BYTES:
+            body, content_type = _cached_static_file(candidate, info)
+            self._send_body(HTTPStatus.OK, content_type + etag_header, body)
+            return
+
+        # Large files go straight from the page cache to the socket.
+        content_type = _content_type_header(candidate)
+        try:
+            handle = candidate.open("rb")
+        except OSError:
+            self._send_text(HTTPStatus.NOT_FOUND, "not found")
+            return
+        with handle:
+            size = os.fstat(handle.fileno()).st_size
+            self._buffer_head(HTTPStatus.OK, content_type + etag_header, size)
+            self.flush_headers()
+            self.connection.sendfile(handle, 0, size)
 
     def _read_json_body(self) -> dict[str, Any] | None:
         try:
@@ -1209,45 +1756,69 @@ class SupportHttpHandler(BaseHTTPRequestHandler):
             return {}
         body = self.rfile.read(length)
         try:
-            payload = json.loads(body.decode("utf-8"))
-        except json.JSONDecodeError:
-            return None
-        if not isinstance(payload, dict):
+            payload = json_loads(body)
+        except ValueError:
             return None
-        return payload
+        return payload if type(payload) is dict else None
 
     def _read_bearer_token(self) -> str:
         raw = self.headers.get("Authorization", "")
         if not isinstance(raw, str):
             return ""
-        prefix = "bearer "
-        if not raw.lower().startswith(prefix):
+        # Lowercase only the scheme prefix, not the whole header value.
+        if raw[:7].lower() != "bearer ":
             return ""
-        return raw[len(prefix) :].strip()
+        return raw[7:].strip()
 
     def _send_json(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
-        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
-        self._send_cors_headers()
-        self.end_headers()
-        if body:
-            self.wfile.write(body)
+        self._send_body(status, CONTENT_TYPE_JSON, json_dumps(payload))
 
     def _send_text(self, status: HTTPStatus, text: str) -> None:
-        body = text.encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "text/plain; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
-        self._send_cors_headers()
-        self.end_headers()
-        self.wfile.write(body)
+        self._send_body(status, CONTENT_TYPE_TEXT, text.encode("utf-8"))
+
+    def _send_body(self, status: HTTPStatus, content_type: bytes, body: bytes) -> None:
+        # The body joins the buffered status line and headers so the whole
+        # response leaves in a single write.
+        self._buffer_head(status, content_type, len(body))
+        self._headers_buffer.append(body)
+        self.flush_headers()
+
+    def _buffer_head(self, status: HTTPStatus, content_type: bytes, length: int | None) -> None:
+        # Equivalent of send_response() + send_header() calls from prebuilt
+        # bytes; content_type is complete header lines ("Content-Type: ...\r\n",
+        # optionally followed by more). length=None omits Content-Length (304).
+        self.log_request(status)
+        if not hasattr(self, "_headers_buffer"):
+            self._headers_buffer = []
+        self._headers_buffer.append(
+            STATUS_LINES[status]
+            + self.server_header
+            + http_date_header()
+            + content_type
+            + (b"Content-Length: %d\r\n" % length if length is not None else b"")
+            + CORS_HEADER_BYTES
+            + b"\r\n"
+        )
+
+
+class SupportHttpServer(ThreadingHTTPServer):
+    # One thread per connection, so idle keep-alive sockets never stall other
+    # clients; the handler's idle timeout reaps them. The listen backlog is
+    # raised from socketserver's default of 5 so bursts of connects queue in
+    # the kernel instead of being refused.
+    request_queue_size = 128
 
-    def _send_cors_headers(self) -> None:
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.send_header("Access-Control-Allow-Methods", "GET,POST,OPTIONS")
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        hub: SupportHub,
+        docs_root: Path,
+    ) -> None:
+        super().__init__(server_address, SupportHttpHandler)
+        self.support_hub = hub
+        self.docs_root = docs_root
+        self.docs_root_str = os.path.realpath(docs_root)
+        self.docs_root_prefix = os.path.join(self.docs_root_str, "")
 
 
 def run_support_server(host: str, port: int, docs_root: Path) -> int:
@@ -1255,10 +1826,8 @@ def run_support_server(host: str, port: int, docs_root: Path) -> int:
     docs_root.mkdir(parents=True, exist_ok=True)
     hub = SupportHub()
     hub.start()
-    httpd = ThreadingHTTPServer((host, port), SupportHttpHandler)
-    httpd.support_hub = hub  # type: ignore[attr-defined]
-    httpd.docs_root = docs_root  # type: ignore[attr-defined]
-    append_jsonl(
+    httpd = SupportHttpServer((host, port), hub, docs_root)
+    hub.store.log_event(
         SUPPORT_TICKET_EVENTS_PATH,
         {
             "event": "support_server_started",
@@ -1273,12 +1842,13 @@ def run_support_server(host: str, port: int, docs_root: Path) -> int:
     except KeyboardInterrupt:
         pass
     finally:
-        hub.stop()
         httpd.server_close()
-        append_jsonl(
+        # Logged before hub.stop() so it lands in the flusher's final batch.
+        hub.store.log_event(
             SUPPORT_TICKET_EVENTS_PATH,
             {"event": "support_server_stopped", "timestamp": now_iso()},
         )
+        hub.stop()
     return 0
 
 
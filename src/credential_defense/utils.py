@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 import hashlib
+import re
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 
 DEFAULT_CATEGORY_ORDER = ["email", "banking", "social", "developer", "other"]
+# Checked in order; the first category with any substring hit wins.
+CATEGORY_TOKENS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("email", ("gmail", "outlook", "yahoo", "proton", "mail", "email")),
+    ("banking", ("bank", "chase", "wellsfargo", "capitalone", "paypal", "amex")),
+    ("social", ("facebook", "instagram", "x.com", "twitter", "reddit", "tiktok", "snapchat")),
+    ("developer", ("github", "gitlab", "bitbucket", "aws", "azure", "cloudflare")),
+)
+_NETLOC_PATTERN = re.compile(r"[^/?#]*")
+_URL_SLOW_PATH_CHARS = re.compile(r"[\t\r\n\[\]]")
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile("|".join(map(re.escape, tokens)))) for category, tokens in CATEGORY_TOKENS
+)
 
 
 def utc_now_iso() -> str:
@@ -43,18 +56,22 @@ def normalize_url(value: str) -> str:
 def domain_from_url(url: str) -> str:
     if not url:
         return ""
-    parsed = urlparse(normalize_url(url))
-    return parsed.netloc.lower().removeprefix("www.")
+    normalized = normalize_url(url)
+    if not normalized:
+        return ""
+    # normalize_url guarantees an http(s):// prefix, so the netloc is the run
+    # up to the first "/", "?" or "#". urlparse only differs for inputs it
+    # rewrites or validates (embedded tab/CR/LF, IPv6 brackets, non-ASCII
+    # netloc checks); defer to it there.
+    if not normalized.isascii() or _URL_SLOW_PATH_CHARS.search(normalized):
+        return urlparse(normalized).netloc.lower().removeprefix("www.")
+    netloc = _NETLOC_PATTERN.match(normalized, normalized.index("://") + 3).group()
+    return netloc.lower().removeprefix("www.")
 
 
 def classify_category(domain: str, service: str = "") -> str:
     label = f"{domain} {service}".lower()
-    if any(token in label for token in ["gmail", "outlook", "yahoo", "proton", "mail", "email"]):
-        return "email"
-    if any(token in label for token in ["bank", "chase", "wellsfargo", "capitalone", "paypal", "amex"]):
-        return "banking"
-    if any(token in label for token in ["facebook", "instagram", "x.com", "twitter", "reddit", "tiktok", "snapchat"]):
-        return "social"
-    if any(token in label for token in ["github", "gitlab", "bitbucket", "aws", "azure", "cloudflare"]):
-        return "developer"
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(label):
+            return category
     return "other"
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import base64
 import json
+import os
+from contextlib import contextmanager
 from dataclasses import asdict
+from typing import Iterator
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 
-from .config import VAULT_META_PATH, VAULT_PATH
+from .config import VAULT_META_PATH, VAULT_PATH, json_dumps
 from .models import CredentialRecord
 from .utils import utc_now_iso
 
@@ -16,6 +19,44 @@ class VaultError(Exception):
     pass
 
 
+def _encode_payload(payload: dict) -> bytes:
+    # The plaintext is only ever read back by json.loads, so it is stored
+    # compact; indentation would only add bytes to encrypt and MAC.
+    return json_dumps(payload)
+
+
+def _merge_records(payload: dict, records: list[CredentialRecord]) -> int:
+    current = {item["record_id"]: item for item in payload.get("records", [])}
+    before = len(current)
+    for record in records:
+        item = asdict(record)
+        item["updated_at"] = utc_now_iso()
+        if record.record_id not in current:
+            item["created_at"] = utc_now_iso()
+        else:
+            item["created_at"] = current[record.record_id].get("created_at", utc_now_iso())
+        current[record.record_id] = item
+    payload["records"] = list(current.values())
+    payload["updated_at"] = utc_now_iso()
+    return len(current) - before
+
+
+class VaultSession:
+    # Decrypted vault held open by LocalEncryptedVault.session(); changes are
+    # written once, when the session closes.
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+        self.dirty = False
+
+    def list_records(self) -> list[CredentialRecord]:
+        return [CredentialRecord.from_dict(item) for item in self._payload.get("records", [])]
+
+    def upsert_records(self, records: list[CredentialRecord]) -> int:
+        added = _merge_records(self._payload, records)
+        self.dirty = True
+        return added
+
+
 class LocalEncryptedVault:
     def exists(self) -> bool:
         return VAULT_PATH.exists() and VAULT_META_PATH.exists()
@@ -42,32 +83,37 @@ class LocalEncryptedVault:
         return [CredentialRecord.from_dict(item) for item in payload.get("records", [])]
 
     def get_record(self, master_password: str, record_id: str) -> CredentialRecord | None:
-        for record in self.list_records(master_password):
-            if record.record_id == record_id:
-                return record
+        # One decrypt; only the matching row becomes a CredentialRecord.
+        for item in self._load_payload(master_password).get("records", []):
+            if item.get("record_id") == record_id:
+                return CredentialRecord.from_dict(item)
         return None
 
     def upsert_records(self, master_password: str, records: list[CredentialRecord]) -> int:
-        payload = self._load_payload(master_password)
-        current = {item["record_id"]: item for item in payload.get("records", [])}
-        before = len(current)
-        for record in records:
-            item = asdict(record)
-            item["updated_at"] = utc_now_iso()
-            if record.record_id not in current:
-                item["created_at"] = utc_now_iso()
-            else:
-                item["created_at"] = current[record.record_id].get("created_at", utc_now_iso())
-            current[record.record_id] = item
-        payload["records"] = list(current.values())
-        payload["updated_at"] = utc_now_iso()
-        self._save_payload(payload, master_password)
-        return len(current) - before
+        # Keep the Fernet from the load so the save does not run scrypt again.
+        payload, fernet = self._open_payload(master_password)
+        added = _merge_records(payload, records)
+        self._write_payload(payload, fernet)
+        return added
 
     def replace_record(self, master_password: str, record: CredentialRecord) -> None:
         self.upsert_records(master_password, [record])
 
+    @contextmanager
+    def session(self, master_password: str) -> Iterator[VaultSession]:
+        # One key derivation and decrypt for a read-modify-write cycle; the
+        # vault is rewritten once on a clean exit, and only if it changed.
+        payload, fernet = self._open_payload(master_password)
+        vault_session = VaultSession(payload)
+        yield vault_session
+        if vault_session.dirty:
+            self._write_payload(payload, fernet)
+
     def _load_payload(self, master_password: str) -> dict:
+        payload, _fernet = self._open_payload(master_password)
+        return payload
+
+    def _open_payload(self, master_password: str) -> tuple[dict, Fernet]:
         if not self.exists():
             raise VaultError("Vault is not initialized. Run `credential-defense init` first.")
         meta = json.loads(VAULT_META_PATH.read_text(encoding="utf-8"))
@@ -78,14 +124,23 @@ class LocalEncryptedVault:
             raw = fernet.decrypt(encrypted_blob)
         except InvalidToken as exc:
             raise VaultError("Invalid vault password.") from exc
-        return json.loads(raw.decode("utf-8"))
+        return json.loads(raw.decode("utf-8")), fernet
 
     def _save_payload(self, payload: dict, master_password: str) -> None:
         meta = json.loads(VAULT_META_PATH.read_text(encoding="utf-8"))
         key = self._derive_key(master_password, meta)
-        fernet = Fernet(key)
-        encoded = json.dumps(payload, indent=2).encode("utf-8")
-        VAULT_PATH.write_bytes(fernet.encrypt(encoded))
+        self._write_payload(payload, Fernet(key))
+
+    def _write_payload(self, payload: dict, fernet: Fernet) -> None:
+        encoded = _encode_payload(payload)
+        # Write aside and rename so an interrupted save never leaves a
+        # truncated vault behind.
+        tmp_path = VAULT_PATH.with_name(VAULT_PATH.name + ".tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(fernet.encrypt(encoded))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, VAULT_PATH)
 
     def _derive_key(self, master_password: str, meta: dict) -> bytes:
         kdf = Scrypt(
@@ -100,7 +155,5 @@ class LocalEncryptedVault:
 
     @staticmethod
     def _random_bytes(size: int) -> bytes:
-        import os
-
         return os.urandom(size)
 
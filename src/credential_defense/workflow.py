@@ -11,20 +11,19 @@ from .prompts import prompt_choice, prompt_yes_no
 from .utils import DEFAULT_CATEGORY_ORDER, utc_now_iso
 
 
-def _priority_index(category: str, priority_order: list[str]) -> int:
-    try:
-        return priority_order.index(category)
-    except ValueError:
-        return len(priority_order)
-
-
 def _task_id(record_id: str, action_type: str) -> str:
     return hashlib.sha256(f"{record_id}|{action_type}".encode("utf-8")).hexdigest()[:20]
 
 
 def _sort_records(records: list[CredentialRecord], settings: dict[str, Any]) -> list[CredentialRecord]:
     priority_order = settings.get("priority_categories", DEFAULT_CATEGORY_ORDER)
-    return sorted(records, key=lambda item: (_priority_index(item.category, priority_order), item.service.lower(), item.username.lower()))
+    # Rank lookup by dict instead of list.index per record; the first
+    # occurrence wins for repeated categories, as with list.index.
+    ranks: dict[str, int] = {}
+    for position, category in enumerate(priority_order):
+        ranks.setdefault(category, position)
+    fallback = len(priority_order)
+    return sorted(records, key=lambda item: (ranks.get(item.category, fallback), item.service.lower(), item.username.lower()))
 
 
 def run_guided_session(
@@ -12,17 +12,24 @@ Behavior:
 """
 from __future__ import annotations
 
-import argparse
-import importlib.util
 import json
 import os
 import re
 import sys
-from dataclasses import asdict, dataclass
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Runtime artifacts are machine-read; DT_JSON_PRETTY=1 restores indented output.
+_PRETTY_ARTIFACTS = os.environ.get("DT_JSON_PRETTY") == "1"
+
 TRIGGER_PHRASES = (
     "DT_FULL_AUTO",
     "AUTO_RESOLVE",
@@ -30,6 +37,18 @@ TRIGGER_PHRASES = (
     "DT_AUTORUN",
     "COMPLETE_DT",
 )
+_TRIGGER_PATTERN = re.compile("|".join(map(re.escape, TRIGGER_PHRASES)), re.IGNORECASE)
+
+# Checked in priority order; the first type with any substring hit wins.
+ISSUE_TYPE_TOKENS = (
+    ("security", ("security", "breach", "watchdog", "credential", "android")),
+    ("integration", ("merge", "merged", "integration", "integrate")),
+    ("configuration", ("config", "setting", "policy", "profile")),
+    ("error_bug", ("error", "traceback", "exception", "crash", "fail")),
+)
+_ISSUE_TYPE_PATTERNS = tuple(
+    (issue_type, re.compile("|".join(map(re.escape, tokens)))) for issue_type, tokens in ISSUE_TYPE_TOKENS
+)
 
 DEFAULT_MCP_POLICY = {
     "local_first_servers": ["memory", "sequential-thinking", "filesystem", "time", "zen", "zen-mcp"],
@@ -85,12 +104,8 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _utc_now_iso() -> str:
-    return _utc_now().isoformat().replace("+00:00", "Z")
-
-
-def _legacy_timestamp() -> str:
-    return datetime.utcnow().isoformat()
+def _utc_now_iso(now: Optional[datetime] = None) -> str:
+    return (now or _utc_now()).isoformat().replace("+00:00", "Z")
 
 
 def _resolve_workspace_root(workspace_root: Optional[Union[str, Path]] = None) -> Path:
@@ -109,6 +124,12 @@ def _extract_trigger(issue_input: str) -> tuple[str, bool]:
     if not text:
         return text, False
 
+    # One case-insensitive sweep rules out the common no-trigger input.
+    # Non-ASCII text keeps the upper() path, since str.upper() can expand
+    # characters (e.g. "\u00df" -> "SS") in ways re.IGNORECASE does not.
+    if text.isascii() and _TRIGGER_PATTERN.search(text) is None:
+        return text, False
+
     upper = text.upper()
     for trigger in TRIGGER_PHRASES:
         if trigger in upper:
@@ -120,14 +141,9 @@ def _extract_trigger(issue_input: str) -> tuple[str, bool]:
 
 def _guess_issue_type(issue_text: str) -> str:
     lower = issue_text.lower()
-    if any(token in lower for token in ("security", "breach", "watchdog", "credential", "android")):
-        return "security"
-    if any(token in lower for token in ("merge", "merged", "integration", "integrate")):
-        return "integration"
-    if any(token in lower for token in ("config", "setting", "policy", "profile")):
-        return "configuration"
-    if any(token in lower for token in ("error", "traceback", "exception", "crash", "fail")):
-        return "error_bug"
+    for issue_type, pattern in _ISSUE_TYPE_PATTERNS:
+        if pattern.search(lower):
+            return issue_type
     return "general"
 
 
@@ -180,9 +196,28 @@ def _infer_actionable_profile(issue_text: str, user_notes: Optional[str] = None)
     }
 
 
+def _json_dumps(payload: Any, *, pretty: bool = True) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            # Router results pass through as-is. Without OPT_NON_STR_KEYS orjson
+            # refuses int dict keys (and >64-bit ints); stdlib json takes both.
+            pass
+    if pretty:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _load_json_file(path: Path) -> dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _json_loads(path.read_bytes())
     except Exception:
         return {}
 
@@ -331,6 +366,8 @@ def _derive_mcp_guidance(workspace_root: Path, issue_type: str) -> dict[str, Any
 
 
 def _load_module_from_path(module_path: Path, module_name: str):
+    import importlib.util  # only satellite routing needs it
+
     spec = importlib.util.spec_from_file_location(module_name, module_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Unable to load module spec from {module_path}")
@@ -340,27 +377,70 @@ def _load_module_from_path(module_path: Path, module_name: str):
     return module
 
 
+_ROUTER_MODULE_CACHE: dict[Path, tuple[int, Any]] = {}
+
+
+def _load_router_module(module_path: Path, module_name: str):
+    # Re-executing the router on every issue is only needed when it changed.
+    mtime_ns = module_path.stat().st_mtime_ns
+    cached = _ROUTER_MODULE_CACHE.get(module_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    module = _load_module_from_path(module_path, module_name)
+    _ROUTER_MODULE_CACHE[module_path] = (mtime_ns, module)
+    return module
+
+
+# workspace root -> (D_T_System mtime, error, monotonic expiry). The TTL also
+# re-probes on filesystems whose directory mtime misses a new router file.
+_ROUTER_MISS: dict[Path, tuple[Optional[int], str, float]] = {}
+_ROUTER_MISS_TTL_SECONDS = 30.0
+
+
 def _try_satellite_routing(
     workspace_root: Path,
     issue_input: str,
     user_notes: Optional[str],
     auto_execute: bool,
 ) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+    router_dir = workspace_root / "D_T_System"
     candidates = (
-        workspace_root / "D_T_System" / "bootstrap_router.py",
-        workspace_root / "D_T_System" / "dt_satellite_router.py",
+        router_dir / "bootstrap_router.py",
+        router_dir / "dt_satellite_router.py",
     )
 
+    # Fallback-only workspaces cost one stat: a router appearing in (or the
+    # creation of) D_T_System bumps the directory mtime and re-arms the probe.
+    try:
+        dir_mtime_ns: Optional[int] = router_dir.stat().st_mtime_ns
+    except OSError:
+        dir_mtime_ns = None
+    miss = _ROUTER_MISS.get(workspace_root)
+    if miss is not None and miss[0] == dir_mtime_ns and time.monotonic() < miss[2]:
+        return None, miss[1]
+
     errors: list[str] = []
+    # One directory listing answers both existence checks.
+    try:
+        with os.scandir(router_dir) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        present = set()
+
+    if not any(module_path.name in present for module_path in candidates):
+        error = " | ".join(f"{module_path.name}: missing" for module_path in candidates)
+        _ROUTER_MISS[workspace_root] = (dir_mtime_ns, error, time.monotonic() + _ROUTER_MISS_TTL_SECONDS)
+        return None, error
+    _ROUTER_MISS.pop(workspace_root, None)
 
     for module_path in candidates:
-        if not module_path.exists():
+        if module_path.name not in present:
             errors.append(f"{module_path.name}: missing")
             continue
 
         try:
             module_name = f"_dt_router_{module_path.stem}"
-            module = _load_module_from_path(module_path, module_name)
+            module = _load_router_module(module_path, module_name)
             route_issue = getattr(module, "route_issue", None)
             if not callable(route_issue):
                 errors.append(f"{module_path.name}: route_issue() not found")
@@ -384,22 +464,34 @@ def _runtime_root(workspace_root: Path) -> Path:
     return workspace_root / "systems" / "D_T_System"
 
 
+_RUNTIME_DIRS_READY: set[Path] = set()
+
+
 def _ensure_runtime_dirs(base: Path) -> None:
+    # The runtime tree only needs creating once per process; repeat issues
+    # skip the four mkdir round trips.
+    if base in _RUNTIME_DIRS_READY:
+        return
     (base / "data" / "context").mkdir(parents=True, exist_ok=True)
     (base / "resolutions").mkdir(parents=True, exist_ok=True)
     (base / "logs").mkdir(parents=True, exist_ok=True)
     (base / "phase_tracking").mkdir(parents=True, exist_ok=True)
+    _RUNTIME_DIRS_READY.add(base)
 
 
 def _phase_tracking_path(base: Path) -> Path:
     return base / "phase_tracking" / "phase_progress.json"
 
 
-def _ensure_phase_tracking(base: Path) -> None:
+_PHASE_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+
+def _ensure_phase_tracking(base: Path, now_iso: Optional[str] = None) -> None:
     path = _phase_tracking_path(base)
-    if path.exists():
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    else:
+    now_iso = now_iso or _utc_now_iso()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         payload = {
             "phases": {
                 "triage": {"completion_percentage": 0.0, "status": "not_started"},
@@ -408,14 +500,26 @@ def _ensure_phase_tracking(base: Path) -> None:
                 "documentation": {"completion_percentage": 0.0, "status": "not_started"},
             }
         }
-    payload["updated_at"] = _utc_now_iso()
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-
-def _append_log(base: Path, message: str) -> None:
-    log_file = base / "logs" / f"dt_system_{_utc_now().strftime('%Y%m%d')}.log"
-    with log_file.open("a", encoding="utf-8") as handle:
-        handle.write(f"{_utc_now_iso()} {message}\n")
+    else:
+        cached = _PHASE_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            payload = cached[1]
+        else:
+            payload = _json_loads(path.read_bytes())
+        # Only updated_at would move; skip the rewrite within the same second.
+        if str(payload.get("updated_at", ""))[:19] == now_iso[:19]:
+            _PHASE_CACHE[path] = (mtime_ns, payload)
+            return
+    payload["updated_at"] = now_iso
+    path.write_bytes(_json_dumps(payload, pretty=_PRETTY_ARTIFACTS))
+    _PHASE_CACHE[path] = (path.stat().st_mtime_ns, payload)
+
+
+def _append_log(base: Path, message: str, now: Optional[datetime] = None) -> None:
+    now = now or _utc_now()
+    log_file = base / "logs" / f"dt_system_{now.strftime('%Y%m%d')}.log"
+    with log_file.open("ab") as handle:
+        handle.write(f"{_utc_now_iso(now)} {message}\n".encode("utf-8"))
 
 
 @dataclass
@@ -456,63 +560,78 @@ class DTResolution:
         return "unknown"
 
     def to_dict(self) -> dict[str, Any]:
-        payload = asdict(self)
-        payload["certainty_assessment"] = asdict(self.certainty_assessment)
+        # Callers only serialize the result, so skip the recursive deep copy
+        # asdict() would make. Each list/dict field is copied one level deep,
+        # so editing the result's fields leaves the resolution intact; values
+        # nested further down are shared and must not be mutated.
+        payload = {key: _copy_container(value) for key, value in self.__dict__.items()}
+        payload["certainty_assessment"] = {
+            key: _copy_container(value) for key, value in self.certainty_assessment.__dict__.items()
+        }
         return payload
 
 
+def _copy_container(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return value.copy()
+    return value
+
+
+_HANDOFF_TEMPLATE = (
+    "# D_T SYSTEM - CODE REVIEW HANDOFF\n"
+    "\n"
+    "## Issue Analysis\n"
+    "**Type**: {issue_type}\n"
+    "\n"
+    "## Problem Description\n"
+    "{description}\n"
+    "\n"
+    "{routing_note}"
+    "{mcp_guidance}"
+    "## Code Review Instructions\n"
+    "1. Memory-first analysis using local D_T memory artifacts.\n"
+    "2. Validate required resources and runtime constraints.\n"
+    "3. Implement fixes and run verification commands.\n"
+    "4. Update D_T memory/context after completion."
+)
+_HANDOFF_ROUTING_NOTE = (
+    "## Routing Note\n"
+    "Satellite routing was unavailable; local fallback context/resolution was recorded.\n"
+    "Details: {route_error}\n"
+    "\n"
+)
+_HANDOFF_MCP_GUIDANCE = (
+    "## MCP Server Guidance\n"
+    "Recommended: {recommended}\n"
+    "Non-beneficial for this issue: {non_beneficial}\n"
+    "Rationale: {rationale}\n"
+    "\n"
+)
+
+
 def _build_handoff(
     issue_input: str,
     issue_type: str,
     route_error: Optional[str],
     mcp_guidance: Optional[dict[str, Any]] = None,
 ) -> str:
-    lines = [
-        "# D_T SYSTEM - CODE REVIEW HANDOFF",
-        "",
-        "## Issue Analysis",
-        f"**Type**: {issue_type}",
-        "",
-        "## Problem Description",
-        issue_input.strip() or "(none)",
-        "",
-    ]
-    if route_error:
-        lines.extend(
-            [
-                "## Routing Note",
-                "Satellite routing was unavailable; local fallback context/resolution was recorded.",
-                f"Details: {route_error}",
-                "",
-            ]
-        )
+    routing_note = _HANDOFF_ROUTING_NOTE.format(route_error=route_error) if route_error else ""
 
+    guidance_block = ""
     if mcp_guidance:
-        recommended = ", ".join(mcp_guidance.get("recommended_servers", [])) or "(none)"
-        non_beneficial = ", ".join(mcp_guidance.get("non_beneficial_servers", [])) or "(none)"
-        rationale = str(mcp_guidance.get("rationale", "")).strip() or "Issue-specific MCP guidance applied."
-        lines.extend(
-            [
-                "## MCP Server Guidance",
-                f"Recommended: {recommended}",
-                f"Non-beneficial for this issue: {non_beneficial}",
-                f"Rationale: {rationale}",
-                "",
-            ]
+        guidance_block = _HANDOFF_MCP_GUIDANCE.format(
+            recommended=", ".join(mcp_guidance.get("recommended_servers", [])) or "(none)",
+            non_beneficial=", ".join(mcp_guidance.get("non_beneficial_servers", [])) or "(none)",
+            rationale=str(mcp_guidance.get("rationale", "")).strip() or "Issue-specific MCP guidance applied.",
         )
 
-    lines.extend(
-        [
-            "## Code Review Instructions",
-            "1. Memory-first analysis using local D_T memory artifacts.",
-            "2. Validate required resources and runtime constraints.",
-            "3. Implement fixes and run verification commands.",
-            "4. Update D_T memory/context after completion.",
-        ]
+    return _HANDOFF_TEMPLATE.format(
+        issue_type=issue_type,
+        description=issue_input.strip() or "(none)",
+        routing_note=routing_note,
+        mcp_guidance=guidance_block,
     )
 
-    return "\n".join(lines)
-
 
 def _write_memory_entity(
     base: Path,
@@ -520,9 +639,11 @@ def _write_memory_entity(
     issue_id: str,
     issue_type: str,
     context_path: Path,
+    now_iso: Optional[str] = None,
+    workspace: Optional[str] = None,
 ) -> None:
+    # base/data exists: callers run _ensure_runtime_dirs first.
     memory_file = base / "data" / "mcp_memory.jsonl"
-    memory_file.parent.mkdir(parents=True, exist_ok=True)
 
     entry = {
         "type": "entity",
@@ -532,13 +653,13 @@ def _write_memory_entity(
             f"Issue ID: {issue_id}",
             f"Issue Type: {issue_type}",
             "Certainty: low (0.0%)",
-            f"Workspace: {base.parent.parent}",
+            f"Workspace: {workspace or base.parent.parent}",
             f"Context: {context_path}",
-            f"Updated: {_utc_now_iso()}",
+            f"Updated: {now_iso or _utc_now_iso()}",
         ],
     }
-    with memory_file.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry) + "\n")
+    with memory_file.open("ab") as handle:
+        handle.write(_json_dumps(entry, pretty=False) + b"\n")
 
 
 def _persist_local_resolution(
@@ -549,11 +670,16 @@ def _persist_local_resolution(
     automation_requested: bool,
     route_error: Optional[str],
 ) -> DTResolution:
+    # One clock read stamps every artifact written for this resolution.
+    now = _utc_now()
+    now_iso = _utc_now_iso(now)
+    workspace_str = str(workspace_root)
+
     runtime = _runtime_root(workspace_root)
     _ensure_runtime_dirs(runtime)
-    _ensure_phase_tracking(runtime)
+    _ensure_phase_tracking(runtime, now_iso)
 
-    issue_id = f"DT_{_utc_now().strftime('%Y%m%d_%H%M%S')}"
+    issue_id = f"DT_{now.strftime('%Y%m%d_%H%M%S')}"
     issue_type = _guess_issue_type(issue_input)
     actionable_profile = _infer_actionable_profile(issue_input, user_notes)
     mcp_guidance = _derive_mcp_guidance(workspace_root, issue_type)
@@ -668,20 +794,21 @@ def _persist_local_resolution(
 
     context_payload = {
         "automation_executed": automation_requested,
-        "created_at": _utc_now_iso(),
+        "created_at": now_iso,
         "issue_id": issue_id,
         "issue_type": issue_type,
         "todo_count": 0,
-        "updated_at": _utc_now_iso(),
-        "workspace_root": str(workspace_root),
+        "updated_at": now_iso,
+        "workspace_root": workspace_str,
     }
 
     context_path = runtime / "data" / "context" / f"{issue_id}.context.json"
-    context_path.write_text(json.dumps(context_payload, indent=2), encoding="utf-8")
+    context_path.write_bytes(_json_dumps(context_payload, pretty=_PRETTY_ARTIFACTS))
 
     resolution_payload = {
         "issue_id": issue_id,
-        "timestamp": _legacy_timestamp(),
+        # Legacy readers expect naive UTC here.
+        "timestamp": now.replace(tzinfo=None).isoformat(),
         "issue_context": issue_context,
         "certainty_level": resolution.certainty_assessment.level,
         "confidence_percentage": resolution.certainty_assessment.confidence_percentage,
@@ -698,10 +825,17 @@ def _persist_local_resolution(
         "automation_result": resolution.automation_result,
     }
     resolution_path = runtime / "resolutions" / f"{issue_id}.json"
-    resolution_path.write_text(json.dumps(resolution_payload, indent=2), encoding="utf-8")
+    resolution_path.write_bytes(_json_dumps(resolution_payload, pretty=_PRETTY_ARTIFACTS))
 
-    _write_memory_entity(runtime, issue_id=issue_id, issue_type=issue_type, context_path=context_path)
-    _append_log(runtime, f"Fallback local D_T resolution recorded: {issue_id}")
+    _write_memory_entity(
+        runtime,
+        issue_id=issue_id,
+        issue_type=issue_type,
+        context_path=context_path,
+        now_iso=now_iso,
+        workspace=workspace_str,
+    )
+    _append_log(runtime, f"Fallback local D_T resolution recorded: {issue_id}", now)
 
     print(f"[DT] Fallback local resolution recorded: {issue_id}")
     print(f"[DT] Resolution file: {resolution_path}")
@@ -838,6 +972,8 @@ def process_issue_with_dt(
 
 
 def _main() -> int:
+    import argparse  # CLI only; importers of this module never parse args
+
     parser = argparse.ArgumentParser(description="D_T compatibility entrypoint")
     parser.add_argument("issue", help="Issue description to process")
     parser.add_argument("--notes", default=None, help="Optional notes")
@@ -846,7 +982,7 @@ def _main() -> int:
 
     resolution = process_issue_with_dt(args.issue, user_notes=args.notes)
     if args.json:
-        print(json.dumps(resolution.to_dict(), indent=2))
+        print(_json_dumps(resolution.to_dict()).decode("utf-8"))
     else:
         print(f"Issue ID: {resolution.issue_id}")
         print(f"Status: {resolution.status}")
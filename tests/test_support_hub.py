@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from credential_defense import support_hub  # noqa: E402
+from credential_defense.support_hub import extract_first_json_object, sanitize_text  # noqa: E402
+
+
+class SanitizeTextTests(unittest.TestCase):
+    def test_declared_password_followed_by_key_value(self) -> None:
+        self.assertEqual(sanitize_text("password is pwd: hunter2"), "password is [REDACTED]")
+        self.assertEqual(sanitize_text("my password is token= abc123"), "my password is [REDACTED]")
+
+    def test_secret_key_value(self) -> None:
+        self.assertEqual(sanitize_text("api_key=abc123, next"), "api_key=[REDACTED], next")
+
+    def test_long_token(self) -> None:
+        token = "A" * 30
+        self.assertEqual(sanitize_text(f"see {token} here"), "see [REDACTED_TOKEN] here")
+        self.assertEqual(sanitize_text(f"/api/{token}"), "/api/[REDACTED_TOKEN]")
+
+    def test_long_token_uses_word_boundaries(self) -> None:
+        # LONG_TOKEN_PATTERN is anchored with \b, so the match starts at the
+        # first word character of a run and a Unicode letter glued to the
+        # run blocks it entirely.
+        token = "A" * 30
+        self.assertEqual(sanitize_text("--" + token), "--[REDACTED_TOKEN]")
+        self.assertEqual(sanitize_text(token + "--"), "[REDACTED_TOKEN]--")
+        self.assertEqual(sanitize_text("\u00e9" + token), "\u00e9" + token)
+        self.assertEqual(sanitize_text("-" * 40), "-" * 40)
+        self.assertEqual(sanitize_text("x" * 27), "x" * 27)
+        self.assertEqual(sanitize_text("x" * 28), "[REDACTED_TOKEN]")
+
+    def test_passes_run_in_order(self) -> None:
+        # The key/value and declared forms run before the long-token pass, so
+        # a long secret keeps its label instead of becoming a bare token.
+        value = "B" * 30
+        self.assertEqual(sanitize_text(f"token={value}"), "token=[REDACTED]")
+        self.assertEqual(sanitize_text(f"password: {value}"), "password=[REDACTED]")
+        self.assertEqual(sanitize_text(f"my password is {value}"), "my password is [REDACTED]")
+        self.assertEqual(sanitize_text(f"Password is {value}, thanks"), "Password is [REDACTED], thanks")
+
+    def test_plain_text_unchanged(self) -> None:
+        self.assertEqual(sanitize_text("  hello there  "), "hello there")
+
+
+class ExtractFirstJsonObjectTests(unittest.TestCase):
+    def test_markdown_wrapper_and_trailing_prose(self) -> None:
+        raw = '```json\n{"summary": "ok", "actions": []}\n```\nLet me know {if} you need more.'
+        self.assertEqual(extract_first_json_object(raw), {"summary": "ok", "actions": []})
+
+    def test_malformed_outer_object_does_not_yield_nested_one(self) -> None:
+        raw = '{"summary": "ok", "actions": [{"title": "Scan", "route": "RUN_ONE_TIME_SCAN"}'
+        self.assertIsNone(extract_first_json_object(raw))
+
+    def test_non_object_or_missing(self) -> None:
+        self.assertIsNone(extract_first_json_object("no json here"))
+        self.assertIsNone(extract_first_json_object(""))
+
+
+class TicketOpLogReplayTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state = Path(tmp.name)
+        patcher = mock.patch.multiple(
+            support_hub,
+            SUPPORT_TICKETS_PATH=self.state / "tickets.json",
+            SUPPORT_TICKETS_LOG_PATH=self.state / "tickets_log.jsonl",
+            SUPPORT_FEEDBACK_PATH=self.state / "feedback.json",
+            SUPPORT_SUMMARY_PATH=self.state / "summary.json",
+            SUPPORT_TICKET_EVENTS_PATH=self.state / "ticket_events.jsonl",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_log_is_replayed_over_snapshot(self) -> None:
+        snapshot = [{"ticket_id": "TKT-000001", "status": "queued", "created_at": "a", "updated_at": "a"}]
+        (self.state / "tickets.json").write_text(json.dumps(snapshot), encoding="utf-8")
+        ops = [
+            {"op": "create", "ticket_id": "TKT-000001", "status": "queued", "created_at": "a", "updated_at": "a"},
+            {"op": "create", "ticket_id": "TKT-000002", "status": "queued", "created_at": "b", "updated_at": "b"},
+            {"op": "status", "ticket_id": "TKT-000001", "status": "in_progress", "updated_at": "c"},
+            {"op": "status", "ticket_id": "TKT-404", "status": "resolved", "updated_at": "d"},
+        ]
+        lines = [json.dumps(op) for op in ops]
+        lines.insert(2, '{"op": "create", "ticket_id": "TKT-0000')  # torn write
+        (self.state / "tickets_log.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        store = support_hub.SupportStore()
+        tickets = {item["ticket_id"]: item for item in store.list_tickets()}
+        self.assertEqual(sorted(tickets), ["TKT-000001", "TKT-000002"])
+        self.assertEqual(tickets["TKT-000001"]["status"], "in_progress")
+        self.assertEqual(tickets["TKT-000001"]["updated_at"], "c")
+        self.assertEqual(tickets["TKT-000002"]["status"], "queued")
+
+    def test_shutdown_snapshot_truncates_log(self) -> None:
+        store = support_hub.SupportStore()
+        store.create_ticket("bug", "Crash", "Details", "", "test")
+        self.assertTrue((self.state / "tickets_log.jsonl").read_bytes())
+        store.stop_flusher()
+        self.assertEqual((self.state / "tickets_log.jsonl").read_bytes(), b"")
+        self.assertEqual(len(json.loads((self.state / "tickets.json").read_text(encoding="utf-8"))), 1)
+        self.assertEqual([item["title"] for item in support_hub.SupportStore().list_tickets()], ["Crash"])
+
+    def test_aged_ops_are_snapshotted_before_the_op_count(self) -> None:
+        store = support_hub.SupportStore()
+        store.create_ticket("bug", "Crash", "Details", "", "test")
+        self.assertFalse((self.state / "tickets.json").exists())
+        store._ticket_snapshot_at -= support_hub.TICKET_SNAPSHOT_MAX_AGE_SECONDS
+        store.flush()
+        self.assertEqual((self.state / "tickets_log.jsonl").read_bytes(), b"")
+        self.assertEqual(len(json.loads((self.state / "tickets.json").read_text(encoding="utf-8"))), 1)
+
+
+class ChatHistoryTests(unittest.TestCase):
+    def test_matches_raw_and_escaped_session_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "chat.jsonl"
+            rows = [
+                {"session_id": "café", "message": "raw"},
+                {"session_id": "other", "message": "skip"},
+                {"session_id": "café", "message": "escaped"},
+                {"session_id": "plain", "message": "ascii"},
+            ]
+            log_path.write_text(
+                json.dumps(rows[0], ensure_ascii=False)
+                + "\n"
+                + "\n".join(json.dumps(row) for row in rows[1:])
+                + "\n",
+                encoding="utf-8",
+            )
+            with mock.patch.multiple(
+                support_hub,
+                SUPPORT_CHAT_LOG_PATH=log_path,
+                SUPPORT_TICKETS_PATH=Path(tmp) / "tickets.json",
+                SUPPORT_TICKETS_LOG_PATH=Path(tmp) / "tickets_log.jsonl",
+                SUPPORT_FEEDBACK_PATH=Path(tmp) / "feedback.json",
+            ):
+                store = support_hub.SupportStore()
+                self.assertEqual([row["message"] for row in store.chat_history("café")], ["raw", "escaped"])
+                self.assertEqual([row["message"] for row in store.chat_history("plain")], ["ascii"])
+
+
+if __name__ == "__main__":
+    unittest.main()
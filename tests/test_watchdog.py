@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+WATCHDOG_PATH = Path(__file__).resolve().parents[1] / "watchdog" / "watchdog.py"
+_spec = importlib.util.spec_from_file_location("watchdog_script", WATCHDOG_PATH)
+watchdog = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = watchdog
+_spec.loader.exec_module(watchdog)
+
+
+def batch_marker(script: str) -> str:
+    # run_shell_batch scripts open with "echo <marker>0; ...".
+    return script.split(" ", 1)[1].split(";", 1)[0][:-1]
+
+
+class RunShellBatchTests(unittest.TestCase):
+    def run_batch(self, commands: dict[str, str], respond) -> tuple[dict[str, str | None], mock.Mock]:
+        with mock.patch.object(watchdog, "run_adb", side_effect=respond) as run_adb:
+            return watchdog.run_shell_batch(commands, serial="S1"), run_adb
+
+    def test_splits_output_and_maps_failures_to_none(self) -> None:
+        def respond(args: list[str], timeout: int, serial: str) -> str:
+            marker = batch_marker(args[1])
+            return "\n".join(
+                [
+                    f"{marker}0",
+                    "line one",
+                    "line two",
+                    "",
+                    f"{marker}0_rc=0",
+                    f"{marker}1",
+                    "partial output",
+                    "",
+                    f"{marker}1_rc=1",
+                    f"{marker}2",
+                    "",
+                    f"{marker}2_rc=0",
+                ]
+            )
+
+        results, run_adb = self.run_batch({"a": "cmd a", "b": "cmd b", "c": "cmd c"}, respond)
+        self.assertEqual(results, {"a": "line one\nline two", "b": None, "c": ""})
+        self.assertEqual(run_adb.call_count, 1)
+        self.assertEqual(run_adb.call_args.kwargs["timeout"], watchdog.SHELL_BATCH_TIMEOUT_SECONDS)
+
+    def test_output_cannot_forge_markers(self) -> None:
+        def respond(args: list[str], timeout: int, serial: str) -> str:
+            marker = batch_marker(args[1])
+            return "\n".join(
+                [
+                    f"{marker}0",
+                    "__watchdog_000000000000_0_rc=0",
+                    "real",
+                    "",
+                    f"{marker}0_rc=0",
+                ]
+            )
+
+        results, _run_adb = self.run_batch({"a": "cmd a", "b": "cmd b"}, respond)
+        self.assertEqual(results, {"a": "__watchdog_000000000000_0_rc=0\nreal", "b": None})
+
+    def test_empty_batch_skips_adb(self) -> None:
+        results, run_adb = self.run_batch({}, lambda *args, **kwargs: "")
+        self.assertEqual(results, {})
+        run_adb.assert_not_called()
+
+
+class GetDevicePropsTests(unittest.TestCase):
+    def test_transport_failure_gives_empty_props(self) -> None:
+        with mock.patch.object(watchdog, "run_adb", side_effect=watchdog.ADBError("device offline")):
+            props = watchdog.get_device_props(serial="S1")
+        self.assertEqual(props, dict.fromkeys(watchdog.SNAPSHOT_DEVICE_PROPS, ""))
+
+
+class ParseGrantedPermissionsTests(unittest.TestCase):
+    DUMPSYS = [
+        "Packages:",
+        "  Package [com.example.app] (1a2b3c):",
+        "      android.permission.CAMERA: granted=true",
+        "      android.permission.INTERNET: granted=false",
+        "  Package [org.safe.notes] (4d5e6f):",
+        "      android.permission.RECORD_AUDIO: granted=true",
+        "Shared users:",
+        "  Package [com.after.end] (7a8b9c):",
+        "      android.permission.READ_SMS: granted=true",
+    ]
+
+    def test_stops_at_end_of_packages_section(self) -> None:
+        result = watchdog.parse_granted_permissions_from_dumpsys("\n".join(self.DUMPSYS))
+        self.assertEqual(
+            result,
+            {
+                "com.example.app": {"android.permission.CAMERA"},
+                "org.safe.notes": {"android.permission.RECORD_AUDIO"},
+            },
+        )
+
+    def test_stops_after_last_target_block(self) -> None:
+        seen: list[str] = []
+
+        def lines():
+            for line in self.DUMPSYS:
+                seen.append(line)
+                yield line
+
+        result = watchdog.parse_granted_permissions_from_dumpsys(lines(), target_pkgs=["com.example.app"])
+        self.assertEqual(result, {"com.example.app": {"android.permission.CAMERA"}})
+        self.assertEqual(seen[-1], "  Package [org.safe.notes] (4d5e6f):")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,16 +9,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import logging
+import logging.handlers
 import os
 import re
+import secrets
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -34,26 +47,28 @@ UMBRELLA_LAST_SCAN_PATH = STATE_DIR / "umbrella_last_scan.json"
 UMBRELLA_SCHEMA_VERSION = 1
 
 
-WATCHED_PERMISSIONS = {
-    "android.permission.ACCESS_FINE_LOCATION",
-    "android.permission.ACCESS_COARSE_LOCATION",
-    "android.permission.READ_SMS",
-    "android.permission.RECEIVE_SMS",
-    "android.permission.SEND_SMS",
-    "android.permission.READ_CALL_LOG",
-    "android.permission.WRITE_CALL_LOG",
-    "android.permission.READ_CONTACTS",
-    "android.permission.WRITE_CONTACTS",
-    "android.permission.READ_PHONE_STATE",
-    "android.permission.READ_MEDIA_AUDIO",
-    "android.permission.READ_MEDIA_IMAGES",
-    "android.permission.READ_MEDIA_VIDEO",
-    "android.permission.RECORD_AUDIO",
-    "android.permission.CAMERA",
-    "android.permission.POST_NOTIFICATIONS",
-    "android.permission.BODY_SENSORS",
-    "android.permission.QUERY_ALL_PACKAGES",
-}
+WATCHED_PERMISSIONS = frozenset(
+    {
+        "android.permission.ACCESS_FINE_LOCATION",
+        "android.permission.ACCESS_COARSE_LOCATION",
+        "android.permission.READ_SMS",
+        "android.permission.RECEIVE_SMS",
+        "android.permission.SEND_SMS",
+        "android.permission.READ_CALL_LOG",
+        "android.permission.WRITE_CALL_LOG",
+        "android.permission.READ_CONTACTS",
+        "android.permission.WRITE_CONTACTS",
+        "android.permission.READ_PHONE_STATE",
+        "android.permission.READ_MEDIA_AUDIO",
+        "android.permission.READ_MEDIA_IMAGES",
+        "android.permission.READ_MEDIA_VIDEO",
+        "android.permission.RECORD_AUDIO",
+        "android.permission.CAMERA",
+        "android.permission.POST_NOTIFICATIONS",
+        "android.permission.BODY_SENSORS",
+        "android.permission.QUERY_ALL_PACKAGES",
+    }
+)
 
 SUSPICIOUS_PACKAGE_KEYWORDS = {
     "spy",
@@ -69,6 +84,43 @@ SUSPICIOUS_PACKAGE_KEYWORDS = {
     "mobiletracker",
     "thetruthspy",
 }
+SUSPICIOUS_PACKAGE_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(SUSPICIOUS_PACKAGE_KEYWORDS)), re.IGNORECASE
+)
+
+
+SNAPSHOT_DEVICE_PROPS = {
+    "model": "ro.product.model",
+    "manufacturer": "ro.product.manufacturer",
+    "android_release": "ro.build.version.release",
+    "android_sdk": "ro.build.version.sdk",
+}
+
+# One fixed budget for a whole batched adb shell call. It does not grow with
+# the number of commands, so a hung device stalls a scan for at most this long.
+SHELL_BATCH_TIMEOUT_SECONDS = 120
+
+DUMPSYS_PACKAGE_RE = re.compile(r"^\s*Package\s+\[([A-Za-z0-9_.]+)\]")
+DUMPSYS_PERMISSION_RE = re.compile(r"^\s*(android\.permission\.[A-Z0-9_]+):\s+granted=(true|false)")
+# Top-level dumpsys package sections that follow the per-package "Packages:" block.
+DUMPSYS_PACKAGES_END = ("Shared users:", "Package Changes:")
+# Matches "ComponentInfo{com.example/.AdminReceiver}" style tokens.
+ADMIN_COMPONENT_RE = re.compile(r"ComponentInfo\{([A-Za-z0-9_.]+)\/")
+ADMIN_PACKAGE_RE = re.compile(r"package=([A-Za-z0-9_.]+)")
+
+# ro.* build props are fixed until the next boot; they are cached per serial
+# against the kernel boot id, so a reboot (e.g. an OS update) refreshes them.
+BOOT_ID_COMMAND = "cat /proc/sys/kernel/random/boot_id"
+_DEVICE_PROPS_CACHE: Dict[str, Tuple[str, Dict[str, str]]] = {}
+
+SECURITY_SETTING_COMMANDS = {
+    "adb_enabled": "settings get global adb_enabled",
+    "adb_wifi_enabled": "settings get global adb_wifi_enabled",
+    "adb_tcp_port": "settings get global adb_tcp_port",
+    "package_verifier_enable": "settings get global package_verifier_enable",
+    "verifier_verify_adb_installs": "settings get global verifier_verify_adb_installs",
+    "install_non_market_apps": "settings get secure install_non_market_apps",
+}
 
 
 class ADBError(RuntimeError):
@@ -79,7 +131,8 @@ class ADBError(RuntimeError):
 class Alert:
     severity: str
     title: str
-    details: str
+    # Either preformatted markdown or a list of items rendered as "- item" lines.
+    details: str | List[str]
 
 
 @dataclass
@@ -114,15 +167,39 @@ def ensure_dirs() -> None:
     DEVICE_STATE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# The log file stays open across lines. WatchedFileHandler reopens it if it
+# is rotated or removed, and serializes writes from concurrent umbrella scans.
+_FILE_LOG = logging.getLogger("realyn.watchdog")
+_FILE_LOG.propagate = False
+_FILE_LOG.setLevel(logging.INFO)
+_FILE_LOG_LOCK = threading.Lock()
+
+
+def _ensure_file_log_handler() -> None:
+    target = os.path.abspath(LOG_PATH)
+    with _FILE_LOG_LOCK:
+        if any(getattr(handler, "baseFilename", None) == target for handler in _FILE_LOG.handlers):
+            return
+        for handler in list(_FILE_LOG.handlers):
+            _FILE_LOG.removeHandler(handler)
+            handler.close()
+        ensure_dirs()
+        handler = logging.handlers.WatchedFileHandler(target, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _FILE_LOG.addHandler(handler)
+
+
 def log(message: str) -> None:
-    ensure_dirs()
     line = f"{now_utc()} {message}"
     print(line)
-    with LOG_PATH.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    _ensure_file_log_handler()
+    _FILE_LOG.info(line)
 
 
+@lru_cache(maxsize=1)
 def resolve_adb() -> str:
+    # Cached per process. Failures are never cached, and run_adb clears the
+    # cache if the resolved binary can no longer be started.
     env_adb = os.environ.get("ADB_BIN")
     candidates = [
         env_adb if env_adb else "",
@@ -137,19 +214,27 @@ def resolve_adb() -> str:
     )
 
 
-def run_adb(args: List[str], timeout: int = 60, serial: str = "") -> str:
-    adb_bin = resolve_adb()
-    command = [adb_bin]
+def adb_command(args: List[str], serial: str = "") -> List[str]:
+    command = [resolve_adb()]
     if serial.strip():
         command.extend(["-s", serial.strip()])
     command.extend(args)
-    process = subprocess.run(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        timeout=timeout,
-    )
+    return command
+
+
+def run_adb(args: List[str], timeout: int = 60, serial: str = "") -> str:
+    command = adb_command(args, serial=serial)
+    try:
+        process = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+        )
+    except OSError as exc:
+        resolve_adb.cache_clear()
+        raise ADBError(f"adb could not be started: {exc}") from exc
     if process.returncode != 0:
         stderr = process.stderr.strip()
         stdout = process.stdout.strip()
@@ -158,6 +243,54 @@ def run_adb(args: List[str], timeout: int = 60, serial: str = "") -> str:
     return process.stdout
 
 
+def run_adb_stream(args: List[str], timeout: int = 60, serial: str = "") -> Iterator[str]:
+    """Yield adb stdout line by line instead of buffering the whole output.
+
+    Failures surface once the stream is exhausted, with the same ADBError and
+    TimeoutExpired semantics as run_adb.
+    """
+    command = adb_command(args, serial=serial)
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                bufsize=1 << 20,
+            )
+        except OSError as exc:
+            resolve_adb.cache_clear()
+            raise ADBError(f"adb could not be started: {exc}") from exc
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        completed = False
+        try:
+            for line in process.stdout:
+                yield line.rstrip("\n")
+            completed = True
+        finally:
+            timer.cancel()
+            if not completed:
+                # Consumer stopped early; do not leave adb running.
+                process.kill()
+            process.stdout.close()
+            returncode = process.wait()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+        if returncode != 0:
+            stderr_file.seek(0)
+            msg = stderr_file.read().decode("utf-8", "replace").strip()
+            raise ADBError(f"adb {' '.join(args)} failed: {msg}")
+
+
 def parse_devices(output: str) -> List[Dict[str, str]]:
     devices: List[Dict[str, str]] = []
     for line in output.splitlines():
@@ -211,25 +344,53 @@ def run_shell(command: str, serial: str = "") -> str:
     return run_adb(["shell", normalized], serial=serial).strip()
 
 
-def getprop(name: str, serial: str = "") -> str:
-    return run_shell(f"getprop {name}", serial=serial)
-
+def run_shell_batch(
+    commands: Dict[str, str], serial: str = "", timeout: int = SHELL_BATCH_TIMEOUT_SECONDS
+) -> Dict[str, str | None]:
+    """Run independent shell commands in one adb round trip.
+
+    Each command's stripped stdout is returned under its key, or None when
+    that command exited non-zero, so callers keep their per-command fallbacks.
+    """
+    if not commands:
+        return {}
+    keys = list(commands)
+    # A per-call nonce keeps command output from forging section markers.
+    marker = f"__watchdog_{secrets.token_hex(6)}_"
+    script = "; ".join(
+        f"echo {marker}{index}; {commands[key].strip()}; rc=$?; echo; echo {marker}{index}_rc=$rc"
+        for index, key in enumerate(keys)
+    )
+    output = run_adb(["shell", script], timeout=timeout, serial=serial)
 
-def getprop_soft(name: str, serial: str = "") -> str:
-    try:
-        return getprop(name, serial=serial)
-    except ADBError:
-        return ""
+    results: Dict[str, str | None] = dict.fromkeys(keys)
+    index = -1
+    section: List[str] = []
+    for line in output.splitlines():
+        if not line.startswith(marker):
+            if index >= 0:
+                section.append(line)
+            continue
+        tag = line[len(marker):].strip()
+        if "_rc=" in tag:
+            position, _, rc = tag.partition("_rc=")
+            if index >= 0 and position == str(index) and rc == "0":
+                results[keys[index]] = "\n".join(section).strip()
+            index = -1
+        elif tag.isdigit() and int(tag) < len(keys):
+            index = int(tag)
+            section = []
+    return results
 
 
 def parse_pm_packages(output: str) -> List[str]:
-    packages: List[str] = []
-    for line in output.splitlines():
-        line = line.strip()
-        if not line.startswith("package:"):
-            continue
-        packages.append(line.removeprefix("package:"))
-    return sorted(set(packages))
+    return sorted(
+        {
+            line[len("package:"):]
+            for line in map(str.strip, output.splitlines())
+            if line.startswith("package:")
+        }
+    )
 
 
 def list_third_party_packages(serial: str = "") -> List[str]:
@@ -261,110 +422,152 @@ def parse_accessibility_services(raw: str) -> List[str]:
 
 
 def parse_active_admins(raw: str) -> List[str]:
-    # Matches "ComponentInfo{com.example/.AdminReceiver}" style tokens.
-    pkgs = set(re.findall(r"ComponentInfo\{([A-Za-z0-9_.]+)\/", raw))
+    pkgs = set(ADMIN_COMPONENT_RE.findall(raw))
     if pkgs:
         return sorted(pkgs)
     # Fallback for dumpsys output that may include "package=com.example".
-    pkgs = set(re.findall(r"package=([A-Za-z0-9_.]+)", raw))
+    pkgs = set(ADMIN_PACKAGE_RE.findall(raw))
     return sorted(pkgs)
 
 
-def parse_granted_permissions_from_dumpsys(raw: str) -> Dict[str, Set[str]]:
-    package_re = re.compile(r"^\s*Package\s+\[([A-Za-z0-9_.]+)\]")
-    perm_re = re.compile(
-        r"^\s*(android\.permission\.[A-Z0-9_]+):\s+granted=(true|false)"
-    )
+def parse_granted_permissions_from_dumpsys(
+    raw: str | Iterable[str], target_pkgs: Iterable[str] | None = None
+) -> Dict[str, Set[str]]:
+    """Collect granted permissions per package from `dumpsys package` output.
+
+    Parsing stops at the end of the Packages section. With target_pkgs it also
+    stops as soon as the last of those packages' blocks has been read.
+    """
     current_pkg = ""
     result: Dict[str, Set[str]] = {}
+    remaining = set(target_pkgs) if target_pkgs is not None else None
 
-    for line in raw.splitlines():
-        pkg_match = package_re.match(line)
-        if pkg_match:
-            current_pkg = pkg_match.group(1)
-            result.setdefault(current_pkg, set())
-            continue
-
-        if not current_pkg:
-            continue
+    lines = raw.splitlines() if isinstance(raw, str) else raw
+    for line in lines:
+        if line.startswith(DUMPSYS_PACKAGES_END):
+            break
+        # Substring checks are exact prefilters for both patterns and skip
+        # the regex engine on the bulk of dumpsys lines.
+        if "Package" in line:
+            pkg_match = DUMPSYS_PACKAGE_RE.match(line)
+            if pkg_match:
+                if remaining is not None:
+                    remaining.discard(current_pkg)
+                    if not remaining:
+                        break
+                current_pkg = pkg_match.group(1)
+                result.setdefault(current_pkg, set())
+                continue
 
-        perm_match = perm_re.match(line)
-        if not perm_match:
+        if not current_pkg or "granted=true" not in line:
             continue
 
-        permission = perm_match.group(1)
-        granted = perm_match.group(2) == "true"
-        if granted:
-            result[current_pkg].add(permission)
+        perm_match = DUMPSYS_PERMISSION_RE.match(line)
+        if perm_match and perm_match.group(2) == "true":
+            result[current_pkg].add(perm_match.group(1))
 
     return result
 
 
-def get_security_settings(serial: str = "") -> Dict[str, str]:
-    checks = {
-        "adb_enabled": "settings get global adb_enabled",
-        "adb_wifi_enabled": "settings get global adb_wifi_enabled",
-        "adb_tcp_port": "settings get global adb_tcp_port",
-        "package_verifier_enable": "settings get global package_verifier_enable",
-        "verifier_verify_adb_installs": "settings get global verifier_verify_adb_installs",
-        "install_non_market_apps": "settings get secure install_non_market_apps",
-    }
+def security_settings_from_batch(results: Dict[str, str | None], prefix: str = "") -> Dict[str, str]:
     data: Dict[str, str] = {}
-    for key, cmd in checks.items():
-        try:
-            data[key] = run_shell(cmd, serial=serial)
-        except ADBError:
-            data[key] = "unavailable"
+    for key in SECURITY_SETTING_COMMANDS:
+        value = results.get(prefix + key)
+        data[key] = value if value is not None else "unavailable"
     return data
 
 
+def run_batch_with_device_props(
+    commands: Dict[str, str], serial: str
+) -> Tuple[Dict[str, str | None], Dict[str, str]]:
+    prop_commands = {f"prop:{key}": f"getprop {prop}" for key, prop in SNAPSHOT_DEVICE_PROPS.items()}
+    cached = _DEVICE_PROPS_CACHE.get(serial)
+    batch = dict(commands)
+    batch["boot_id"] = BOOT_ID_COMMAND
+    if cached is None:
+        batch.update(prop_commands)
+    results = run_shell_batch(batch, serial=serial)
+
+    boot_id = results["boot_id"] or ""
+    if cached is not None:
+        if boot_id and cached[0] == boot_id:
+            return results, dict(cached[1])
+        results.update(run_shell_batch(prop_commands, serial=serial))
+    props = {key: results[f"prop:{key}"] or "" for key in SNAPSHOT_DEVICE_PROPS}
+    if boot_id and all(props.values()):
+        _DEVICE_PROPS_CACHE[serial] = (boot_id, dict(props))
+    return results, props
+
+
+def get_device_props(serial: str = "") -> Dict[str, str]:
+    # Soft read, like the per-prop getprop calls it replaced: identity falls
+    # back to empty strings rather than failing on a flaky transport.
+    try:
+        return run_batch_with_device_props({}, serial)[1]
+    except ADBError:
+        return dict.fromkeys(SNAPSHOT_DEVICE_PROPS, "")
+
+
 def collect_snapshot(serial: str = "") -> Dict[str, object]:
     device = require_connected_device(serial)
     selected_serial = device["serial"]
 
-    third_party_packages = list_third_party_packages(serial=selected_serial)
+    # Every independent read goes out in one adb round trip; a command that
+    # failed inside the batch falls back to its original single-call path.
+    batch = {
+        "packages": "pm list packages -3",
+        "accessibility": "settings get secure enabled_accessibility_services",
+        "admins": "dpm list active-admins",
+    }
+    batch.update((f"setting:{key}", cmd) for key, cmd in SECURITY_SETTING_COMMANDS.items())
+    results, props = run_batch_with_device_props(batch, selected_serial)
 
-    accessibility = parse_accessibility_services(
-        run_shell(
-            "settings get secure enabled_accessibility_services",
-            serial=selected_serial,
-        )
-    )
+    packages_raw = results["packages"]
+    third_party_packages = parse_pm_packages(packages_raw) if packages_raw is not None else []
+    if not third_party_packages:
+        third_party_packages = list_third_party_packages(serial=selected_serial)
 
-    try:
-        admins_raw = run_shell("dpm list active-admins", serial=selected_serial)
-        device_admins = parse_active_admins(admins_raw)
-    except ADBError:
+    accessibility_raw = results["accessibility"]
+    if accessibility_raw is None:
+        accessibility_raw = run_shell(batch["accessibility"], serial=selected_serial)
+    accessibility = parse_accessibility_services(accessibility_raw)
+
+    admins_raw = results["admins"]
+    if admins_raw is None:
         # Fallback for devices that don't expose "dpm list active-admins" to shell.
         admins_raw = run_shell("dumpsys device_policy", serial=selected_serial)
-        device_admins = parse_active_admins(admins_raw)
+    device_admins = parse_active_admins(admins_raw)
 
-    perms_dump = run_shell("dumpsys package", serial=selected_serial)
-    granted_perms = parse_granted_permissions_from_dumpsys(perms_dump)
+    # dumpsys package runs to megabytes on busy devices; stream it through the
+    # parser rather than holding the whole dump (and its line list) in memory.
+    # Closing the stream once parsing stops early kills adb instead of draining the rest.
+    dumpsys_lines = run_adb_stream(["shell", "dumpsys package"], serial=selected_serial)
+    try:
+        granted_perms = parse_granted_permissions_from_dumpsys(
+            dumpsys_lines, target_pkgs=third_party_packages
+        )
+    finally:
+        dumpsys_lines.close()
 
     high_risk_permissions: Dict[str, List[str]] = {}
     for pkg in third_party_packages:
-        pkg_perms = granted_perms.get(pkg, set())
-        risky = sorted(pkg_perms.intersection(WATCHED_PERMISSIONS))
+        # Packages dumpsys never listed need no empty-set placeholder.
+        pkg_perms = granted_perms.get(pkg)
+        if not pkg_perms:
+            continue
+        risky = pkg_perms & WATCHED_PERMISSIONS
         if risky:
-            high_risk_permissions[pkg] = risky
+            high_risk_permissions[pkg] = sorted(risky)
 
     suspicious_packages = sorted(
-        [
-            pkg
-            for pkg in third_party_packages
-            if any(keyword in pkg.lower() for keyword in SUSPICIOUS_PACKAGE_KEYWORDS)
-        ]
+        pkg for pkg in third_party_packages if SUSPICIOUS_PACKAGE_RE.search(pkg)
     )
 
     snapshot: Dict[str, object] = {
         "captured_at": now_utc(),
         "device": {
             "serial": selected_serial,
-            "model": getprop_soft("ro.product.model", serial=selected_serial),
-            "manufacturer": getprop_soft("ro.product.manufacturer", serial=selected_serial),
-            "android_release": getprop_soft("ro.build.version.release", serial=selected_serial),
-            "android_sdk": getprop_soft("ro.build.version.sdk", serial=selected_serial),
+            **props,
             "adb_state": device.get("state", ""),
             "adb_extras": device.get("extras", ""),
         },
@@ -377,7 +580,7 @@ def collect_snapshot(serial: str = "") -> Dict[str, object]:
         "third_party_packages": third_party_packages,
         "enabled_accessibility_services": accessibility,
         "active_device_admin_packages": device_admins,
-        "security_settings": get_security_settings(serial=selected_serial),
+        "security_settings": security_settings_from_batch(results, prefix="setting:"),
         "high_risk_permissions": high_risk_permissions,
         "suspicious_named_packages": suspicious_packages,
     }
@@ -385,15 +588,30 @@ def collect_snapshot(serial: str = "") -> Dict[str, object]:
 
 
 def read_json(path: Path) -> Dict[str, object]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode_json(data: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # Snapshots and umbrella state are plain JSON types; stdlib json
+            # still takes whatever orjson refuses (ints wider than 64 bits, say).
+            pass
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
 
 
 def write_json(path: Path, data: Dict[str, object]) -> None:
     ensure_dirs()
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    path.write_bytes(encode_json(data))
 
 
 def safe_serial_token(serial: str) -> str:
@@ -424,7 +642,7 @@ def make_alerts(
             Alert(
                 severity="medium",
                 title="New third-party apps detected",
-                details="\n".join(f"- {pkg}" for pkg in added),
+                details=added,
             )
         )
     if removed:
@@ -432,31 +650,34 @@ def make_alerts(
             Alert(
                 severity="low",
                 title="Third-party apps removed since baseline",
-                details="\n".join(f"- {pkg}" for pkg in removed),
+                details=removed,
             )
         )
 
+    # One-directional diffs only need the baseline side as a set.
     base_access = set(baseline.get("enabled_accessibility_services", []))
-    curr_access = set(current.get("enabled_accessibility_services", []))
-    new_access = sorted(curr_access - base_access)
+    new_access = sorted(
+        {svc for svc in current.get("enabled_accessibility_services", []) if svc not in base_access}
+    )
     if new_access:
         alerts.append(
             Alert(
                 severity="high",
                 title="New accessibility services enabled",
-                details="\n".join(f"- {svc}" for svc in new_access),
+                details=new_access,
             )
         )
 
     base_admins = set(baseline.get("active_device_admin_packages", []))
-    curr_admins = set(current.get("active_device_admin_packages", []))
-    new_admins = sorted(curr_admins - base_admins)
+    new_admins = sorted(
+        {pkg for pkg in current.get("active_device_admin_packages", []) if pkg not in base_admins}
+    )
     if new_admins:
         alerts.append(
             Alert(
                 severity="high",
                 title="New device admin apps enabled",
-                details="\n".join(f"- {pkg}" for pkg in new_admins),
+                details=new_admins,
             )
         )
 
@@ -475,7 +696,7 @@ def make_alerts(
                 Alert(
                     severity="medium",
                     title=f"Security setting changed: {key}",
-                    details=f"- baseline: {old_value}\n- current: {new_value}",
+                    details=[f"baseline: {old_value}", f"current: {new_value}"],
                 )
             )
 
@@ -485,7 +706,7 @@ def make_alerts(
             Alert(
                 severity="high",
                 title="Potential stalkerware package names detected",
-                details="\n".join(f"- {pkg}" for pkg in suspicious),
+                details=list(suspicious),
             )
         )
 
@@ -493,15 +714,16 @@ def make_alerts(
     current_risk = current.get("high_risk_permissions", {})
     for pkg, permissions in current_risk.items():
         old_permissions = set(baseline_risk.get(pkg, []))
-        new_permissions = sorted(set(permissions) - old_permissions)
+        new_permissions = sorted({perm for perm in permissions if perm not in old_permissions})
         if not new_permissions:
             continue
-        severity = "high" if pkg in added else "medium"
+        # Same as membership in `added`, without scanning the sorted list.
+        severity = "high" if pkg in curr_pkgs and pkg not in base_pkgs else "medium"
         alerts.append(
             Alert(
                 severity=severity,
                 title=f"High-risk permissions newly observed: {pkg}",
-                details="\n".join(f"- {perm}" for perm in new_permissions),
+                details=new_permissions,
             )
         )
 
@@ -509,18 +731,21 @@ def make_alerts(
 
 
 def count_alerts(alerts: List[Alert]) -> Tuple[int, int, int]:
-    high_count = sum(1 for alert in alerts if alert.severity == "high")
-    medium_count = sum(1 for alert in alerts if alert.severity == "medium")
-    low_count = sum(1 for alert in alerts if alert.severity == "low")
-    return high_count, medium_count, low_count
+    counts = Counter(alert.severity for alert in alerts)
+    return counts["high"], counts["medium"], counts["low"]
 
 
-def write_alert_report(alerts: List[Alert], snapshot: Dict[str, object], serial: str = "") -> Path:
+def write_alert_report(
+    alerts: List[Alert],
+    snapshot: Dict[str, object],
+    serial: str = "",
+    counts: Tuple[int, int, int] | None = None,
+) -> Path:
     ensure_dirs()
     ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
     suffix = f"-{safe_serial_token(serial)}" if serial.strip() else ""
     report_path = ALERT_DIR / f"alert-{ts}{suffix}.md"
-    high_count, medium_count, low_count = count_alerts(alerts)
+    high_count, medium_count, low_count = counts if counts is not None else count_alerts(alerts)
 
     device = snapshot.get("device", {})
     report_serial = device.get("serial", serial).strip()
@@ -537,14 +762,15 @@ def write_alert_report(alerts: List[Alert], snapshot: Dict[str, object], serial:
     ]
 
     for alert in alerts:
-        lines.extend(
-            [
-                f"## [{alert.severity.upper()}] {alert.title}",
-                "",
-                alert.details if alert.details else "- no details",
-                "",
-            ]
-        )
+        lines.append(f"## [{alert.severity.upper()}] {alert.title}")
+        lines.append("")
+        if not alert.details:
+            lines.append("- no details")
+        elif isinstance(alert.details, str):
+            lines.append(alert.details)
+        else:
+            lines.extend(f"- {item}" for item in alert.details)
+        lines.append("")
 
     report_path.write_text("\n".join(lines), encoding="utf-8")
     return report_path
@@ -589,11 +815,12 @@ def scan_device(
     write_json(last_scan_path, current)
 
     alerts = make_alerts(baseline, current, ignore_adb_debug=ignore_adb_debug)
-    high_count, medium_count, low_count = count_alerts(alerts)
+    counts = count_alerts(alerts)
+    high_count, medium_count, low_count = counts
 
     report_path: Path | None = None
     if alerts:
-        report_path = write_alert_report(alerts, current, serial=normalized_serial)
+        report_path = write_alert_report(alerts, current, serial=normalized_serial, counts=counts)
         log(
             "[watchdog] alerts generated "
             f"(serial={current.get('device', {}).get('serial', normalized_serial)}, "
@@ -643,20 +870,30 @@ def run_scan(ignore_adb_debug: bool, serial: str = "") -> int:
 def run_watch(interval: int, ignore_adb_debug: bool, serial: str = "") -> int:
     target = serial.strip() if serial.strip() else "default-device"
     log(f"[watchdog] watch mode started (interval={interval}s, target={target})")
+    next_deadline = time.monotonic()
     while True:
+        next_deadline += interval
         try:
             run_scan(ignore_adb_debug=ignore_adb_debug, serial=serial)
         except Exception as exc:  # noqa: BLE001
             log(f"[watchdog] scan failed: {exc}")
-        time.sleep(interval)
+        # Sleep to a fixed monotonic cadence so scan time does not add to the
+        # period; if a scan overran its slot, start the next one right away.
+        now = time.monotonic()
+        if next_deadline <= now:
+            if interval > 0:
+                log(f"[watchdog] scan overran the {interval}s interval; rescheduling from now")
+            next_deadline = now
+        time.sleep(next_deadline - now)
 
 
 def read_optional_json(path: Path) -> Dict[str, Any] | None:
     if not path.exists():
         return None
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        payload = read_json(path)
+    except (OSError, ValueError):
+        # ValueError covers json and orjson decode errors alike.
         return None
     if not isinstance(payload, dict):
         return None
@@ -716,12 +953,13 @@ def device_alias(identity: Dict[str, str]) -> str:
 def fetch_device_identity(serial: str) -> Dict[str, str]:
     connected = require_connected_device(serial)
     selected_serial = connected["serial"]
+    props = get_device_props(serial=selected_serial)
     return {
         "serial": selected_serial,
-        "manufacturer": getprop_soft("ro.product.manufacturer", serial=selected_serial),
-        "model": getprop_soft("ro.product.model", serial=selected_serial),
-        "android_release": getprop_soft("ro.build.version.release", serial=selected_serial),
-        "android_sdk": getprop_soft("ro.build.version.sdk", serial=selected_serial),
+        "manufacturer": props["manufacturer"],
+        "model": props["model"],
+        "android_release": props["android_release"],
+        "android_sdk": props["android_sdk"],
     }
 
 
@@ -950,15 +1188,21 @@ def run_umbrella_scan(ignore_adb_debug: bool, all_connected: bool) -> int:
             "No eligible devices to scan. Connect linked devices or run with --all-connected."
         )
 
-    results: List[DeviceScanResult] = []
-    for serial in target_serials:
-        result = scan_device(
-            ignore_adb_debug=ignore_adb_debug,
-            serial=serial,
-            auto_create_baseline=True,
+    # Each device sits behind its own adb transport, so scan them concurrently;
+    # results come back in target order.
+    with ThreadPoolExecutor(max_workers=min(len(target_serials), 8)) as executor:
+        results: List[DeviceScanResult] = list(
+            executor.map(
+                lambda serial: scan_device(
+                    ignore_adb_debug=ignore_adb_debug,
+                    serial=serial,
+                    auto_create_baseline=True,
+                ),
+                target_serials,
+            )
         )
-        results.append(result)
 
+    for result in results:
         if state is not None:
             identity = {
                 "serial": result.serial,